@@ -4,16 +4,43 @@ Integrated Advanced Test Generation Engine
 Combines basic and advanced analysis for comprehensive test generation
 """
 
+import atexit
+import functools
+import itertools
 import os
 import sys
 import tempfile
 import subprocess
 import json
+import logging
+import orjson
+import queue
+from collections import Counter
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import requests
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-import networkx as nx
+import rustworkx as rx
+import ahocorasick
 import re
+
+# Linear-time DFA engine for the bulk scanners when available: the analyzer
+# patterns are regular (no backreferences), so re2 matches them in O(n) and
+# cannot backtrack catastrophically on minified bundles. Fall back to re.
+try:
+    import re2 as re_dfa
+except ImportError:
+    re_dfa = re
+
+# Real HTML parser for .html/.vue sources when available: one C-level parse
+# yields every attribute regardless of ordering, where the regex variants need
+# one pattern per attribute order. JSX/TSX stays on the regex path because its
+# attribute values are JS expressions, not HTML.
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 from dotenv import load_dotenv
 import time
 from datetime import datetime
@@ -21,13 +48,34 @@ from datetime import datetime
 # === Load .env configuration ===
 load_dotenv()
 
-# Environment variables
-OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "codellama:instruct")
-OLLAMA_API_URL = os.getenv("OLLAMA_API_URL", "http://localhost:11434/api/generate")
-MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", "10000"))
-LOCAL_SERVER_URL = os.getenv("LOCAL_SERVER_URL", "http://localhost:3000")
-MAX_WAIT_SECONDS = int(os.getenv("MAX_WAIT_SECONDS", "30"))
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
+# Environment configuration, read exactly once at import and frozen so no
+# per-call os.environ lookups can creep back in later
+@dataclass(frozen=True)
+class Config:
+    ollama_model: str
+    ollama_api_url: str
+    max_file_size: int
+    local_server_url: str
+    max_wait_seconds: int
+    github_token: str
+
+
+CFG = Config(
+    ollama_model=os.getenv("OLLAMA_MODEL", "codellama:instruct"),
+    ollama_api_url=os.getenv("OLLAMA_API_URL", "http://localhost:11434/api/generate"),
+    max_file_size=int(os.getenv("MAX_FILE_SIZE", "10000")),
+    local_server_url=os.getenv("LOCAL_SERVER_URL", "http://localhost:3000"),
+    max_wait_seconds=int(os.getenv("MAX_WAIT_SECONDS", "30")),
+    github_token=os.getenv("GITHUB_TOKEN", ""),
+)
+
+# Activity logging goes through stdlib logging: handlers are thread-safe and
+# %-style call sites defer formatting until a record is actually emitted
+STEP = 25
+SUCCESS = 26
+logging.addLevelName(STEP, "STEP")
+logging.addLevelName(SUCCESS, "SUCCESS")
+logger = logging.getLogger(__name__)
 
 # Dynamic paths - will be set per run
 LOG_DIR = None
@@ -35,6 +83,521 @@ TEST_OUTPUT_DIR = None
 REPORT_DIR = None
 RUN_DIR = None
 
+# Directories that never contain project source we care about; walking into
+# node_modules alone can mean hundreds of thousands of wasted stat calls
+_SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'coverage', '.venv', '__pycache__'}
+
+# Static portions of the per-flow prompt - identical across flows, so format
+# them once at import and only interpolate the small dynamic middle per call
+_FLOW_PROMPT_PREFIX = """You are a senior QA automation architect specializing in Playwright test generation.
+
+Your task is to generate a COMPREHENSIVE Playwright test file for the following specific user flow.
+
+**CRITICAL REQUIREMENTS:**
+1. Generate ONLY the test file for this specific user flow
+2. Create ALL necessary test cases to cover this flow completely
+3. Include success paths, error paths, validation scenarios, and edge cases
+4. Use the exact routes, components, UI elements, and API endpoints from the flow
+5. NO OUTPUT LIMITS - generate as many test cases as needed for complete coverage
+6. Make the tests realistic and actionable
+
+**USER FLOW TO TEST:**
+"""
+
+_FLOW_PROMPT_SUFFIX = """
+**IMPORTANT:**
+- Generate COMPLETE test coverage for this user flow
+- Include proper imports, test structure, and assertions
+- Use realistic test data and API mocking
+- Test all steps and scenarios described in the flow
+- Make sure the code is syntactically correct and complete
+- NO LIMITS on number of test cases - create comprehensive coverage"""
+
+# Boundary patterns for LLM output parsing - locating markers with one
+# C-level sweep avoids per-line strip/startswith over large responses
+_FLOW_HEADER_PATTERN = re.compile(r'(?m)^[ \t]*## Flow:[ \t]*(.+)$')
+_CODE_FENCE_OPEN_PATTERN = re.compile(r'(?m)^[ \t]*```typescript[ \t]*$')
+_CODE_FENCE_CLOSE_PATTERN = re.compile(r'(?m)^[ \t]*```[ \t]*$')
+
+# Pre-compiled regex patterns - these run once per source file, so compile
+# them at import time instead of going through re's cache on every call
+_IMPORT_PATTERNS = [re.compile(p) for p in (
+    r"import\s+.*?\s+from\s+['\"]([^'\"]+)['\"]",
+    r"import\s+['\"]([^'\"]+)['\"]",
+    r"require\(['\"]([^'\"]+)['\"]\)",
+    r"from\s+['\"]([^'\"]+)['\"]"
+)]
+
+# Single alternation covering both import and route patterns so the
+# dependency-graph build walks each file's content exactly once; the named
+# group tells us which bucket a match belongs to
+_IMPORT_GROUPS = {'imp_from', 'imp_bare', 'req', 'bare_from'}
+_IMPORT_ROUTE_PATTERN = re.compile(
+    r"import\s+.*?\s+from\s+['\"](?P<imp_from>[^'\"]+)['\"]"
+    r"|import\s+['\"](?P<imp_bare>[^'\"]+)['\"]"
+    r"|require\(['\"](?P<req>[^'\"]+)['\"]\)"
+    r"|from\s+['\"](?P<bare_from>[^'\"]+)['\"]"
+    r"|<Route\s+path=['\"](?P<route_path>[^'\"]+)['\"]"
+    r"|path=['\"](?P<path_el>[^'\"]+)['\"]\s+element="
+    r"|<Navigate\s+to=['\"](?P<nav_to>[^'\"]+)['\"]"
+    r"|navigate\(['\"](?P<nav_call>[^'\"]+)['\"]\)"
+    r"|href=['\"](?P<href>[^'\"]+)['\"]"
+    r"|to=['\"](?P<to_attr>[^'\"]+)['\"]",
+    re.IGNORECASE
+)
+
+_ROUTE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # <Route path="/dashboard" element={<Dashboard />} />
+    r'<Route\s+path=["\']([^"\']+)["\']',
+    r'path=["\']([^"\']+)["\']\s+element=',
+    # <Navigate to="/dashboard" />
+    r'<Navigate\s+to=["\']([^"\']+)["\']',
+    # navigate("/dashboard")
+    r'navigate\(["\']([^"\']+)["\']\)',
+    r'href=["\']([^"\']+)["\']',
+    r'to=["\']([^"\']+)["\']'
+)]
+
+# Response-parsing patterns for the different output formats Ollama models
+# produce; compiled once since the parsers run for every generation round
+_FILENAME_RE = re.compile(r'FILENAME:\s*(\S+\.spec\.ts)\s*\n(.*?)(?=FILENAME:|$)', re.DOTALL)
+_HASH_RE = re.compile(r'####\s*(\S+\.spec\.ts)\s*\n```typescript\s*\n(.*?)\n```', re.DOTALL)
+_MD_NAMED_RE = re.compile(r'(\w+\.spec\.ts):\s*\n```typescript\s*\n(.*?)\n```', re.DOTALL)
+_MD_BLOCK_RE = re.compile(r'```(?:typescript|javascript|ts|js)\s*\n(.*?)\n```', re.DOTALL)
+_SPEC_NAME_RE = re.compile(r'(\w+\.spec\.ts)')
+# Header lines naming a spec file and fenced code blocks, matched in one
+# forward pass so each block can pick up the filename that preceded it
+_HEADER_OR_BLOCK_RE = re.compile(
+    r'(?P<header>^[^\n]*\.spec\.ts[^\n]*$)'
+    r'|```(?:typescript|javascript|ts|js)\s*\n(?P<block>.*?)\n```',
+    re.DOTALL | re.MULTILINE
+)
+
+# Content indicators for mapping anonymous code blocks to the expected test
+# files; one alternation sweep per block replaces ~30 substring probes
+_INDICATOR_RE = re.compile(
+    r'\b(?P<visual>visual|responsive|viewport|theme|dark|light|mobile|desktop)\b'
+    r'|\b(?P<flow>flow|login|navigation|user|authentication|wizard|form)\b'
+    r'|\b(?P<component>component|interactive|button|modal|dropdown|input)\b'
+    r'|\b(?P<accessibility>accessibility|aria|keyboard|focus|screen reader|tab)\b',
+    re.IGNORECASE
+)
+_INDICATOR_FILES = {
+    'visual': 'visual.spec.ts',
+    'flow': 'flow.spec.ts',
+    'component': 'component.spec.ts',
+    'accessibility': 'accessibility.spec.ts'
+}
+_EXPECTED_TEST_FILES = frozenset(_INDICATOR_FILES.values())
+
+# Component, form, and UI analysis patterns - each of these runs once per
+# component file, so compile them at import time like the patterns above.
+# Every pattern is paired with a cheap lowercase literal sentinel: a plain
+# substring probe decides whether the regex engine needs to run at all,
+# which skips it entirely for the common no-match file
+_INPUT_PATTERNS = [(s, re_dfa.compile(p, re_dfa.IGNORECASE)) for s, p in (
+    ('<input', r'<input[^>]*type=["\']([^"\']*)["\'][^>]*placeholder=["\']([^"\']*)["\'][^>]*>'),
+    ('<input', r'<input[^>]*placeholder=["\']([^"\']*)["\'][^>]*type=["\']([^"\']*)["\'][^>]*>'),
+    ('<input', r'<input[^>]*name=["\']([^"\']*)["\'][^>]*>'),
+    ('<textarea', r'<textarea[^>]*placeholder=["\']([^"\']*)["\'][^>]*>'),
+    ('<select', r'<select[^>]*>'),
+    ('<button', r'<button[^>]*>([^<]*)</button>')
+)]
+_COMPONENT_API_RE = re_dfa.compile(r'(?:fetch|axios|api)\(["\']([^"\']+)["\']')
+_STATE_PATTERNS = [(s, re_dfa.compile(p)) for s, p in (
+    ('usestate', r'useState\(["\']([^"\']*)["\']'),
+    ('setstate', r'setState\(["\']([^"\']*)["\']'),
+    ('usestate', r'const\s+(\w+)\s*=\s*useState')
+)]
+_FIELD_PATTERNS = [(s, re_dfa.compile(p, re_dfa.IGNORECASE)) for s, p in (
+    ('<input', r'<input[^>]*name=["\']([^"\']*)["\'][^>]*required[^>]*>'),
+    ('<input', r'<input[^>]*required[^>]*name=["\']([^"\']*)["\'][^>]*>'),
+    ('<textarea', r'<textarea[^>]*name=["\']([^"\']*)["\'][^>]*>'),
+    ('<select', r'<select[^>]*name=["\']([^"\']*)["\'][^>]*>')
+)]
+_VALIDATION_PATTERNS = [(s, re_dfa.compile(p)) for s, p in (
+    ('minlength', r'minLength[=:]\s*(\d+)'),
+    ('maxlength', r'maxLength[=:]\s*(\d+)'),
+    ('pattern', r'pattern[=:]\s*["\']([^"\']*)["\']'),
+    ('required', r'required[=:]\s*true')
+)]
+_SUBMIT_PATTERNS = [(s, re_dfa.compile(p)) for s, p in (
+    ('submit', r'onSubmit[=:]\s*{([^}]+)}'),
+    ('submit', r'handleSubmit[=:]\s*{([^}]+)}'),
+    ('submit', r'submit[=:]\s*{([^}]+)}')
+)]
+# All six UI-element extractors folded into one alternation: the content is
+# traversed once and match.lastgroup names the bucket, like the combined
+# import/route pattern above
+_UI_COMBINED_RE = re.compile(
+    r'<button[^>]*>(?P<buttons>[^<]*)</button>'
+    r'|<nav[^>]*>(?P<navigation>[^<]*)</nav>'
+    r'|(?P<dropdowns><select[^>]*>)'
+    r'|(?P<tables><table[^>]*>)'
+    r'|(?:Modal|Dialog|Popup)[^>]*title=["\'](?P<modals>[^"\']*)["\']'
+    r'|(?P<cards>(?:Card|Panel|Box)[^>]*>)',
+    re.IGNORECASE
+)
+_UI_SENTINELS = {
+    'buttons': ('<button',),
+    'modals': ('modal', 'dialog', 'popup'),
+    'navigation': ('<nav',),
+    'dropdowns': ('<select',),
+    'tables': ('<table',),
+    'cards': ('card', 'panel', 'box')
+}
+# Subset of _UI_COMBINED_RE used alongside the HTML parser: Modal/Card style
+# component names are not real tags, so the tree path still finds them by regex
+_MODAL_CARD_RE = re.compile(
+    r'(?:Modal|Dialog|Popup)[^>]*title=["\'](?P<modals>[^"\']*)["\']'
+    r'|(?P<cards>(?:Card|Panel|Box)[^>]*>)',
+    re.IGNORECASE
+)
+_HTML_SUFFIXES = ('.html', '.vue')
+# Feature-detection table: (feature name, tokens, match routes only). A token
+# found in the lowercased corpus (or in the routes alone where flagged) marks
+# the feature present
+_FEATURE_TOKENS = (
+    ("Dashboard Management", ('dashboard',), False),
+    ("Create Operations", ('create',), False),
+    ("Edit Operations", ('edit',), False),
+    ("Delete Operations", ('delete',), False),
+    ("Project Management", ('project',), False),
+    ("User Management", ('user', 'profile'), True),
+    ("Content Management", ('content',), False),
+    ("File Management", ('file', 'upload', 'download'), True),
+    ("Search and Filtering", ('search', 'filter'), True),
+    ("Settings and Configuration", ('setting', 'config'), True),
+    ("E-commerce", ('cart', 'checkout', 'order'), True),
+    ("Blog/Content Publishing", ('blog', 'post', 'article'), True),
+    ("Analytics and Reporting", ('analytics', 'report', 'stats'), True),
+    ("Communication", ('message', 'chat', 'notification'), True),
+    ("Calendar/Scheduling", ('calendar', 'schedule', 'event'), True),
+)
+# One compiled probe for generated-test validation: the Playwright import
+# header followed (anywhere later) by a test declaration, replacing three
+# separate substring scans per file
+_VALID_TEST_RE = re.compile(
+    r"import\s*\{\s*test,\s*expect\s*\}.*?(?:test\.describe|test\(')",
+    re.DOTALL
+)
+
+# All sentinels feed one Aho-Corasick automaton: a single linear sweep over
+# a file discovers every marker at once instead of one substring probe per
+# sentinel per pattern
+_ALL_SENTINELS = set()
+for _table in (_INPUT_PATTERNS, _STATE_PATTERNS, _FIELD_PATTERNS,
+               _VALIDATION_PATTERNS, _SUBMIT_PATTERNS):
+    _ALL_SENTINELS.update(s for s, _ in _table)
+for _sentinels in _UI_SENTINELS.values():
+    _ALL_SENTINELS.update(_sentinels)
+_API_SENTINELS = frozenset(('fetch', 'axios', 'api'))
+_ALL_SENTINELS.update(_API_SENTINELS)
+
+_SENTINEL_AUTOMATON = ahocorasick.Automaton()
+for _sentinel in _ALL_SENTINELS:
+    _SENTINEL_AUTOMATON.add_word(_sentinel, _sentinel)
+_SENTINEL_AUTOMATON.make_automaton()
+
+
+def _sentinel_hits(content_lower: str) -> set:
+    """Return the set of sentinels present in the content in one sweep"""
+    return {found for _, found in _SENTINEL_AUTOMATON.iter(content_lower)}
+
+
+def _parse_html(filename: str, content: str):
+    """Parse genuine HTML sources into a selectolax tree; returns None for
+    JSX/TSX files and when selectolax is not installed"""
+    if HTMLParser is None or not filename.lower().endswith(_HTML_SUFFIXES):
+        return None
+    return HTMLParser(content)
+
+
+def _take(pattern, content: str, n: int) -> List[str]:
+    """First n matches of pattern in content; the scan stops at match n
+    instead of materializing every match in the file. Single-group patterns
+    yield the group, group-less ones the full match"""
+    return list(itertools.islice(
+        (m.group(1) if m.groups() else m.group(0) for m in pattern.finditer(content)), n))
+
+
+def _write_atomic(path: str, text: str) -> None:
+    """Write text via a temp file and atomic rename: one buffered byte write
+    with no incremental-encoder round-trip, and a crash mid-write can never
+    leave a truncated report behind"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+    os.replace(tmp_path, path)
+
+
+def _bulleted(items) -> str:
+    """Render items as one markdown bullet list; joins straight from a
+    generator so no intermediate list is materialized per section"""
+    return '\n'.join(f"- {item}" for item in items)
+
+# One alternation for API-call extraction so each file is scanned once
+# instead of four times; the named groups map back to the original patterns
+_API_CALL_RE = re.compile(
+    r'fetch\(["\'](?P<fetch>[^"\']+)["\']'
+    r'|axios\.(?:get|post|put|delete)\(["\'](?P<axios>[^"\']+)["\']'
+    r'|api\.(?P<api_attr>[^"\']+)'
+    r'|(?P<api_path>/api/[^"\'\s]+)'
+)
+
+
+def _slurp(path: str, limit: Optional[int] = None) -> str:
+    """Read a whole file with one os.read instead of buffered text-mode
+    open(); skips the buffered-IO setup and codec lookup per file, which
+    dominates on many-small-files repositories. A limit caps the read so a
+    stray vendor bundle never materializes as one giant string"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if limit is not None and size > limit:
+            size = limit
+        return os.read(fd, size).decode('utf-8', 'replace')
+    finally:
+        os.close(fd)
+
+
+def _filter_valid_routes(routes: List[str]) -> List[str]:
+    """Filter out matches that are clearly not valid application routes"""
+    valid_routes = []
+    for route in routes:
+        # Skip routes that are clearly not valid paths
+        if (route.startswith('/') and
+            not route.startswith('//') and
+            not route.startswith('/api/') and
+            not route.startswith('http') and
+            not route.startswith('mailto:') and
+            not route.startswith('tel:') and
+            len(route) > 1 and
+            not route.endswith('.css') and
+            not route.endswith('.js') and
+            not route.endswith('.png') and
+            not route.endswith('.jpg') and
+            not route.endswith('.ico')):
+            valid_routes.append(route)
+
+    return list(set(valid_routes))
+
+
+def _scan_imports_and_routes(content: str) -> tuple:
+    """Extract imports and routes in a single pass over the content"""
+    imports = []
+    routes = []
+
+    for match in _IMPORT_ROUTE_PATTERN.finditer(content):
+        value = match.group(match.lastgroup)
+        if match.lastgroup in _IMPORT_GROUPS:
+            imports.append(value)
+        else:
+            routes.append(value)
+
+    return list(set(imports)), _filter_valid_routes(routes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_by_filename(filename_lower: str) -> str:
+    """Classify file role from its (already lowercased) filename"""
+    # Route files
+    if 'route' in filename_lower or 'router' in filename_lower:
+        return 'Route'
+
+    # API files
+    if 'api' in filename_lower or 'service' in filename_lower:
+        return 'API'
+
+    # Component files
+    if any(ext in filename_lower for ext in ['.tsx', '.jsx', '.vue']):
+        return 'Component'
+
+    # Form files
+    if 'form' in filename_lower or 'input' in filename_lower:
+        return 'Form'
+
+    return 'Other'
+
+
+def _analyze_file(file_path: str, content: Optional[str] = None) -> Dict[str, Any]:
+    """Scan a single source file (runs in worker processes)"""
+    filename = os.path.basename(file_path)
+    result = {'filename': filename, 'imports': [], 'routes': [], 'role': 'Other', 'error': None}
+
+    try:
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+        imports, routes = _scan_imports_and_routes(content)
+        result['imports'] = imports
+        result['routes'] = routes
+        result['role'] = _classify_by_filename(filename.lower())
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
+
+
+def _extract_component_info(filename: str, content: str, hits: Optional[set] = None,
+                            tree=None) -> str:
+    """Extract detailed information from a component file"""
+    info_parts = [f"**{filename}**:"]
+    if hits is None:
+        hits = _sentinel_hits(content.lower())
+    if tree is None:
+        tree = _parse_html(filename, content)
+
+    # Extract form elements; the tree path reads attributes directly, so
+    # attribute ordering no longer matters
+    form_elements = []
+    if tree is not None:
+        for node in tree.css('input, textarea, select'):
+            attrs = node.attributes
+            label = attrs.get('type') or attrs.get('name') or node.tag
+            form_elements.append(f"  - {label}: {attrs.get('placeholder') or 'field'}")
+        for node in tree.css('button'):
+            text = (node.text() or '').strip()
+            if text:
+                form_elements.append(f"  - {text}")
+    else:
+        # Only 5 elements survive into the prompt, so stop scanning as soon
+        # as they are collected instead of matching the whole file first
+        for sentinel, pattern in _INPUT_PATTERNS:
+            if len(form_elements) >= 5:
+                break
+            if sentinel not in hits:
+                continue
+            for match in itertools.islice(pattern.finditer(content), 5 - len(form_elements)):
+                groups = match.groups()
+                if len(groups) > 1:
+                    form_elements.append(f"  - {groups[0]}: {groups[1]}")
+                elif groups:
+                    form_elements.append(f"  - {groups[0]}")
+                else:
+                    form_elements.append(f"  - {match.group(0)}")
+
+    if form_elements:
+        info_parts.append("  Form Elements:")
+        info_parts.extend(form_elements[:5])  # Limit to 5 elements
+
+    # Extract API calls (limit to 3)
+    api_calls = _take(_COMPONENT_API_RE, content, 3) if _API_SENTINELS & hits else []
+    if api_calls:
+        info_parts.append("  API Calls:")
+        for api in api_calls:
+            info_parts.append(f"    - {api}")
+
+    # Extract state management (limit to 3)
+    states = []
+    for sentinel, pattern in _STATE_PATTERNS:
+        if len(states) >= 3:
+            break
+        if sentinel in hits:
+            states.extend(_take(pattern, content, 3 - len(states)))
+
+    if states:
+        info_parts.append("  State Variables:")
+        for state in states:
+            info_parts.append(f"    - {state}")
+    
+    return "\n".join(info_parts) if len(info_parts) > 1 else ""
+
+
+def _extract_form_details(filename: str, content: str, hits: Optional[set] = None) -> str:
+    """Extract detailed form information"""
+    form_parts = [f"**{filename}**:"]
+    if hits is None:
+        hits = _sentinel_hits(content.lower())
+
+    # Extract form fields with validation (limit to 5); scanning stops once
+    # the slice that actually reaches the prompt is full
+    fields = []
+    for sentinel, pattern in _FIELD_PATTERNS:
+        if len(fields) >= 5:
+            break
+        if sentinel in hits:
+            fields.extend(_take(pattern, content, 5 - len(fields)))
+
+    if fields:
+        form_parts.append("  Required Fields:")
+        for field in fields:
+            form_parts.append(f"    - {field}")
+
+    # Extract validation rules (limit to 3)
+    validations = []
+    for sentinel, pattern in _VALIDATION_PATTERNS:
+        if len(validations) >= 3:
+            break
+        if sentinel in hits:
+            validations.extend(_take(pattern, content, 3 - len(validations)))
+
+    if validations:
+        form_parts.append("  Validation Rules:")
+        for validation in validations:
+            form_parts.append(f"    - {validation}")
+
+    # Extract submit handlers (limit to 2)
+    submit_handlers = []
+    for sentinel, pattern in _SUBMIT_PATTERNS:
+        if len(submit_handlers) >= 2:
+            break
+        if sentinel in hits:
+            submit_handlers.extend(_take(pattern, content, 2 - len(submit_handlers)))
+
+    if submit_handlers:
+        form_parts.append("  Submit Handlers:")
+        for handler in submit_handlers:
+            form_parts.append(f"    - {handler[:50]}...")
+    
+    return "\n".join(form_parts) if len(form_parts) > 1 else ""
+
+
+def _scan_ui_elements(content: str, hits: Optional[set] = None,
+                      tree=None) -> Dict[str, List[str]]:
+    """Extract UI elements from one file (runs in worker processes)"""
+    elements = {}
+    if hits is None:
+        hits = _sentinel_hits(content.lower())
+    if not any(s in hits for sentinels in _UI_SENTINELS.values() for s in sentinels):
+        return elements
+    if tree is not None:
+        for element_type, selector in (('buttons', 'button'), ('navigation', 'nav')):
+            for node in tree.css(selector):
+                text = (node.text() or '').strip()
+                if text:
+                    elements.setdefault(element_type, []).append(text)
+        for element_type, selector in (('dropdowns', 'select'), ('tables', 'table')):
+            for node in tree.css(selector):
+                elements.setdefault(element_type, []).append(f'<{selector}>')
+        for match in _MODAL_CARD_RE.finditer(content):
+            element_type = match.lastgroup
+            elements.setdefault(element_type, []).append(match.group(element_type))
+        return elements
+    for match in _UI_COMBINED_RE.finditer(content):
+        element_type = match.lastgroup
+        value = match.group(element_type)
+        if element_type in ('buttons', 'navigation'):
+            value = value.strip()
+            if not value:
+                continue
+        elements.setdefault(element_type, []).append(value)
+    return elements
+
+
+def _scan_file_details(filename: str, content: str, is_component: bool, is_form: bool) -> Dict[str, Any]:
+    """Run all detail analyzers over one file in a single fused pass
+    (runs in worker processes); the sentinel sweep happens exactly once"""
+    hits = _sentinel_hits(content.lower())
+    tree = _parse_html(filename, content)
+    return {
+        'component': _extract_component_info(filename, content, hits, tree) if is_component else '',
+        'form': _extract_form_details(filename, content, hits) if is_form else '',
+        'ui': _scan_ui_elements(content, hits, tree),
+    }
+
+
 class IntegratedTestGenerator:
     """Integrated test generator combining basic and advanced analysis"""
     
@@ -42,10 +605,43 @@ class IntegratedTestGenerator:
         self.temp_dir = None
         self.framework = None
         self.files = []
+        self.file_contents = {}  # path -> content, filled during collection
         self.file_roles = {}
+        self._roles_index = {}  # role -> [filenames], built once after classification
+        self._path_by_name = {}  # basename -> full path
+        self._component_files = frozenset()  # analysis targets, prefiltered once
+        self._form_files = frozenset()
+        self._pending_tests = {}  # filename -> content, flushed to disk in one batch
         self.route_map = {}
+        self._routes_preview = []
+        self._components_preview = []
         self.run_timestamp = run_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.activity_log_file = None
+        self._log_handler = None
+        # Fused-analysis results, filled by _analyze_all on first access
+        self._component_details = None
+        self._form_analysis = None
+        self._ui_analysis = None
+        # Shared pool of response-assembly buffers: the grown lists keep
+        # their capacity across calls, so the 4-way parallel generation
+        # doesn't re-grow a fresh chunk list for every response
+        self._buf_pool = queue.LifoQueue()
+        for _ in range(4):
+            self._buf_pool.put([])
+
+        # Reuse one pooled HTTP session for all Ollama calls (keep-alive avoids
+        # a fresh TCP handshake per request); retry transient failures twice
+        # with a short backoff
+        self.session = requests.Session()
+        retries = requests.adapters.Retry(total=2, backoff_factor=0.2)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': 'itg/1.0'
+        })
         
         # Only create directories if this is a real run (not just importing)
         if run_timestamp is not None or self._is_main_execution():
@@ -84,55 +680,50 @@ class IntegratedTestGenerator:
     def _init_activity_log(self):
         """Initialize comprehensive activity logging"""
         try:
-            os.makedirs(LOG_DIR, exist_ok=True)
             self.activity_log_file = f"{LOG_DIR}/activity_log_{self.run_timestamp}.txt"
-            with open(self.activity_log_file, 'w', encoding='utf-8') as f:
-                f.write(f"AI Playwright Test Generator - Activity Log\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 80 + "\n\n")
+            handler = logging.FileHandler(self.activity_log_file, mode='w', encoding='utf-8')
+            handler.setFormatter(logging.Formatter('[%(asctime)s] [%(levelname)s] %(message)s',
+                                                   datefmt='%H:%M:%S'))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            self._log_handler = handler
+            logger.info("AI Playwright Test Generator - Activity Log")
+            logger.info("Generated: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            atexit.register(self._close_activity_log)
             print(f"📝 Activity log initialized: {self.activity_log_file}")
         except Exception as e:
             print(f"❌ Error initializing activity log: {e}")
             self.activity_log_file = None
-    
-    def _log_activity(self, message: str, level: str = "INFO"):
-        """Log activity to comprehensive log file"""
-        if self.activity_log_file:
+            self._log_handler = None
+
+    def _close_activity_log(self):
+        """Flush and detach the activity log handler (safe to call twice)"""
+        if self._log_handler:
             try:
-                timestamp = datetime.now().strftime('%H:%M:%S')
-                with open(self.activity_log_file, 'a', encoding='utf-8') as f:
-                    f.write(f"[{timestamp}] [{level}] {message}\n")
+                logger.removeHandler(self._log_handler)
+                self._log_handler.close()
             except Exception as e:
-                print(f"❌ Error writing to activity log: {e}")
-    
+                print(f"⚠️ Could not close activity log: {e}")
+            self._log_handler = None
+
+
     def _parse_user_flows(self, user_flows_content: str) -> List[Dict[str, str]]:
         """Parse user flows content to extract individual flows"""
         flows = []
-        lines = user_flows_content.split('\n')
-        current_flow = None
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('## Flow:'):
-                # Save previous flow if exists
-                if current_flow:
-                    flows.append(current_flow)
-                
-                # Start new flow
-                flow_name = line.replace('## Flow:', '').strip()
-                current_flow = {
-                    'name': flow_name,
-                    'content': line + '\n',
-                    'filename': self._generate_flow_filename(flow_name)
-                }
-            elif current_flow:
-                current_flow['content'] += line + '\n'
-        
-        # Add the last flow
-        if current_flow:
-            flows.append(current_flow)
-        
-        self._log_activity(f"Parsed {len(flows)} user flows from content")
+
+        # Locate the flow headers in one regex sweep and slice the original
+        # string for each body - no per-line strip/copy over the whole report
+        headers = list(_FLOW_HEADER_PATTERN.finditer(user_flows_content))
+        for i, header in enumerate(headers):
+            flow_name = header.group(1).strip()
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(user_flows_content)
+            flows.append({
+                'name': flow_name,
+                'content': user_flows_content[header.start():end].strip() + '\n',
+                'filename': self._generate_flow_filename(flow_name)
+            })
+
+        logger.info("Parsed %d user flows from content", len(flows))
         return flows
     
     def _generate_flow_filename(self, flow_name: str) -> str:
@@ -152,28 +743,18 @@ class IntegratedTestGenerator:
         filename = flow['filename']
         
         print(f"🔄 Generating comprehensive test for: {flow_name}")
-        self._log_activity(f"Generating test for flow: {flow_name}")
-        
-        # Build focused prompt for this specific flow
-        prompt = f"""You are a senior QA automation architect specializing in Playwright test generation.
-
-Your task is to generate a COMPREHENSIVE Playwright test file for the following specific user flow.
-
-**CRITICAL REQUIREMENTS:**
-1. Generate ONLY the test file for this specific user flow
-2. Create ALL necessary test cases to cover this flow completely
-3. Include success paths, error paths, validation scenarios, and edge cases
-4. Use the exact routes, components, UI elements, and API endpoints from the flow
-5. NO OUTPUT LIMITS - generate as many test cases as needed for complete coverage
-6. Make the tests realistic and actionable
-
-**USER FLOW TO TEST:**
-{flow_content}
-
+        logger.info("Generating test for flow: %s", flow_name)
+        
+        # Build focused prompt for this specific flow: static prefix/suffix
+        # are module constants, only the middle varies per flow
+        prompt = ''.join((
+            _FLOW_PROMPT_PREFIX,
+            flow_content,
+            f"""
 **APPLICATION CONTEXT:**
 Framework: {self.framework}
-Routes: {list(self.route_map.keys())[:10]}
-Components: {list(self.file_roles.keys())[:20]}
+Routes: {self._routes_preview}
+Components: {self._components_preview}
 
 **REQUIRED OUTPUT FORMAT:**
 {filename}:
@@ -187,28 +768,24 @@ test.describe('{flow_name}', () => {{
   // Use exact routes, components, and API endpoints from the flow
 }});
 ```
+""",
+            _FLOW_PROMPT_SUFFIX,
+        ))
 
-**IMPORTANT:**
-- Generate COMPLETE test coverage for this user flow
-- Include proper imports, test structure, and assertions
-- Use realistic test data and API mocking
-- Test all steps and scenarios described in the flow
-- Make sure the code is syntactically correct and complete
-- NO LIMITS on number of test cases - create comprehensive coverage"""
-
-        # Save individual flow prompt to logs
+        # Save individual flow prompt to logs (LOG_DIR already exists from
+        # run setup, no need to re-stat it per flow)
         flow_prompt_file = f"{LOG_DIR}/flow_prompt_{self.run_timestamp}_{filename.replace('.spec.ts', '')}.txt"
-        os.makedirs(LOG_DIR, exist_ok=True)
-        with open(flow_prompt_file, 'w', encoding='utf-8') as f:
-            f.write(prompt)
+        Path(flow_prompt_file).write_text(prompt, encoding='utf-8')
         print(f"📝 Flow prompt saved to: {flow_prompt_file}")
-        self._log_activity(f"Flow prompt saved: {flow_prompt_file}")
+        logger.info("Flow prompt saved: %s", flow_prompt_file)
         
-        # Call Ollama with NO output limits
+        # Call Ollama with NO output limits - stream the response so the
+        # (potentially huge, num_predict=-1) generation is never buffered
+        # server-side as one giant body
         request_data = {
-            'model': OLLAMA_MODEL,
+            'model': CFG.ollama_model,
             'prompt': prompt,
-            'stream': False,
+            'stream': True,
             'options': {
                 'num_predict': -1,  # NO LIMITS - let LLM generate all needed tests
                 'temperature': 0.7,
@@ -216,26 +793,42 @@ test.describe('{flow_name}', () => {{
                 'top_k': 40
             }
         }
-        
+
         try:
-            response = requests.post(
-                OLLAMA_API_URL,
-                json=request_data,
+            # Serialize with orjson and bypass requests' stdlib-json encoder
+            response = self.session.post(
+                CFG.ollama_api_url,
+                data=orjson.dumps(request_data),
+                headers={'Content-Type': 'application/json'},
+                stream=True,
                 timeout=300  # Increased timeout for comprehensive generation
             )
-            
+
             if response.status_code == 200:
-                result = response.json()
-                response_text = result.get('response', '')
+                # NDJSON stream: one chunk per line, stop as soon as done:true.
+                # Assemble into a pooled buffer so worker threads reuse grown
+                # lists instead of re-growing a fresh one per call
+                parts = self._get_buffer()
+                try:
+                    for line in response.iter_lines(decode_unicode=False):
+                        if not line:
+                            continue
+                        chunk = orjson.loads(line)
+                        parts.append(chunk.get('response', ''))
+                        if chunk.get('done'):
+                            break
+                    response_text = ''.join(parts)
+                finally:
+                    parts.clear()
+                    self._buf_pool.put(parts)
                 print(f"✅ Generated comprehensive test for {flow_name}: {len(response_text)} characters")
-                self._log_activity(f"Generated comprehensive test for {flow_name}: {len(response_text)} characters")
+                logger.info("Generated comprehensive test for %s: %d characters", flow_name, len(response_text))
                 
-                # Save response to logs
+                # Save response to logs (bytes write skips newline translation)
                 response_file = f"{LOG_DIR}/flow_response_{self.run_timestamp}_{filename.replace('.spec.ts', '')}.txt"
-                with open(response_file, 'w', encoding='utf-8') as f:
-                    f.write(response_text)
+                Path(response_file).write_bytes(response_text.encode('utf-8'))
                 print(f"📝 Flow response saved to: {response_file}")
-                self._log_activity(f"Flow response saved: {response_file}")
+                logger.info("Flow response saved: %s", response_file)
                 
                 # Parse the response to extract just the test content
                 test_content = self._extract_test_content_from_response(response_text, filename)
@@ -243,72 +836,83 @@ test.describe('{flow_name}', () => {{
             else:
                 error_msg = f"Ollama request failed for {flow_name}: {response.status_code}"
                 print(f"❌ {error_msg}")
-                self._log_activity(error_msg, "ERROR")
+                logger.error(error_msg)
                 return ""
         except Exception as e:
             error_msg = f"Error calling Ollama for {flow_name}: {e}"
             print(f"❌ {error_msg}")
-            self._log_activity(error_msg, "ERROR")
+            logger.error(error_msg)
             return ""
     
     def _extract_test_content_from_response(self, response_text: str, filename: str) -> str:
         """Extract test content from LLM response"""
-        lines = response_text.split('\n')
-        in_code_block = False
-        test_content = []
-        
-        for line in lines:
-            if line.strip().startswith(f"{filename}:"):
-                continue
-            elif line.strip().startswith('```typescript'):
-                in_code_block = True
-                continue
-            elif line.strip() == '```' and in_code_block:
-                break
-            elif in_code_block:
-                test_content.append(line)
-        
-        return '\n'.join(test_content)
+        # Find the fence markers directly and slice between them instead of
+        # walking the response line by line
+        fence_open = _CODE_FENCE_OPEN_PATTERN.search(response_text)
+        if not fence_open:
+            return ''
+
+        fence_close = _CODE_FENCE_CLOSE_PATTERN.search(response_text, fence_open.end())
+        end = fence_close.start() if fence_close else len(response_text)
+        return response_text[fence_open.end():end].strip('\n')
     
     def generate_tests(self, repo_url: str, output_dir: str = "tests") -> Dict[str, Any]:
         """Main test generation pipeline"""
         try:
-            self._log_activity(f"Starting test generation for: {repo_url}")
+            logger.info("Starting test generation for: %s", repo_url)
             
             # Step 1: Process repository (clone or use local)
             print("\n📥 STEP 1: PROCESSING REPOSITORY")
             print("-" * 40)
-            self._log_activity("STEP 1: PROCESSING REPOSITORY", "STEP")
+            logger.log(STEP, "STEP 1: PROCESSING REPOSITORY")
             self.temp_dir = self._clone_repository(repo_url)
-            self._log_activity(f"Repository processed: {self.temp_dir}")
+            logger.info("Repository processed: %s", self.temp_dir)
             
             # Step 2: Detect framework
             print("\n🔍 STEP 2: DETECTING FRAMEWORK")
             print("-" * 40)
-            self._log_activity("STEP 2: DETECTING FRAMEWORK", "STEP")
+            logger.log(STEP, "STEP 2: DETECTING FRAMEWORK")
             self.framework = self._detect_framework()
-            self._log_activity(f"Framework detected: {self.framework}")
+            logger.info("Framework detected: %s", self.framework)
             
             # Step 3: Collect source files
             print("\n📁 STEP 3: COLLECTING SOURCE FILES")
             print("-" * 40)
-            self._log_activity("STEP 3: COLLECTING SOURCE FILES", "STEP")
+            logger.log(STEP, "STEP 3: COLLECTING SOURCE FILES")
             self.files = self._collect_source_files()
-            self._log_activity(f"Source files collected: {len(self.files)} files")
+            logger.info("Source files collected: %d files", len(self.files))
             
             # Step 4: Build dependency graph
             print("\n🕸️ STEP 4: BUILDING DEPENDENCY GRAPH")
             print("-" * 40)
-            self._log_activity("STEP 4: BUILDING DEPENDENCY GRAPH", "STEP")
+            logger.log(STEP, "STEP 4: BUILDING DEPENDENCY GRAPH")
             graph, file_roles, route_map = self._build_dependency_graph(self.files)
             self.file_roles = file_roles
             self.route_map = route_map
-            self._log_activity(f"Dependency graph built: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+            # Short previews reused by every per-flow prompt; islice avoids
+            # materializing the full key lists each time
+            self._routes_preview = list(itertools.islice(self.route_map, 10))
+            self._components_preview = list(itertools.islice(self.file_roles, 20))
+            # Index roles once so later prompt builders don't rescan the whole
+            # file_roles dict per role
+            self._roles_index = {}
+            for filename, role in self.file_roles.items():
+                self._roles_index.setdefault(role, []).append(filename)
+            self._path_by_name = {os.path.basename(f): f for f in self.files}
+            # Prefilter the analysis targets once: the detail pass then does a
+            # single set probe per file instead of a role lookup plus a
+            # lowercased substring test
+            self._component_files = frozenset(self._roles_index.get('Component', ()))
+            self._form_files = frozenset(
+                name for name in self._path_by_name
+                if 'form' in name.lower() or self.file_roles.get(name) == 'Form'
+            )
+            logger.info("Dependency graph built: %d nodes, %d edges", graph.num_nodes(), graph.num_edges())
             
             # Step 5: Export Graphviz
             print("\n📊 STEP 5: EXPORTING GRAPHVIZ")
             print("-" * 40)
-            self._log_activity("STEP 5: EXPORTING GRAPHVIZ", "STEP")
+            logger.log(STEP, "STEP 5: EXPORTING GRAPHVIZ")
             self._export_graphviz(graph, file_roles)
             
             # Step 5.5: Perform comprehensive application analysis
@@ -319,67 +923,78 @@ test.describe('{flow_name}', () => {{
             # Step 5.6: Generate User Flow Description Report
             print("\n📋 STEP 5.6: GENERATING USER FLOW DESCRIPTION REPORT")
             print("-" * 40)
-            self._log_activity("STEP 5.6: GENERATING USER FLOW DESCRIPTION REPORT", "STEP")
+            logger.log(STEP, "STEP 5.6: GENERATING USER FLOW DESCRIPTION REPORT")
             user_flows_content = self._generate_user_flows_report(app_analysis)
-            self._log_activity(f"User flows report generated: {len(user_flows_content)} characters")
+            logger.info("User flows report generated: %d characters", len(user_flows_content))
             
             # Step 6: Parse user flows and generate tests per flow
             print("\n🤖 STEP 6: GENERATING TESTS PER USER FLOW")
             print("-" * 40)
-            self._log_activity("STEP 6: GENERATING TESTS PER USER FLOW", "STEP")
+            logger.log(STEP, "STEP 6: GENERATING TESTS PER USER FLOW")
             
             # Parse user flows
             user_flows = self._parse_user_flows(user_flows_content)
-            self._log_activity(f"Found {len(user_flows)} user flows to generate tests for")
+            logger.info("Found %d user flows to generate tests for", len(user_flows))
             
-            # Generate one test spec per user flow
+            # Generate one test spec per user flow - flows are independent and
+            # each call just blocks on the Ollama HTTP request, so fan them out
+            # to a thread pool (the pooled session is thread-safe)
             test_files = []
-            for i, flow in enumerate(user_flows, 1):
-                print(f"\n📝 Generating test for flow {i}/{len(user_flows)}: {flow['name']}")
-                self._log_activity(f"Generating test for flow: {flow['name']}")
-                
-                # Generate test for this specific flow
-                test_content = self._generate_test_for_flow(flow, app_analysis)
-                if test_content:
-                    # Save the test file
-                    success = self._save_file(flow['filename'], test_content)
-                    if success:
-                        test_files.append(flow['filename'])
-                        self._log_activity(f"Successfully generated test file: {flow['filename']}")
+            flow_workers = int(os.getenv('FLOW_WORKERS', '4'))
+            with ThreadPoolExecutor(max_workers=flow_workers) as executor:
+                futures = {executor.submit(self._generate_test_for_flow, flow, app_analysis): flow
+                           for flow in user_flows}
+                for future in as_completed(futures):
+                    flow = futures[future]
+                    try:
+                        test_content = future.result()
+                    except Exception as e:
+                        logger.error("Flow generation raised for %s: %s", flow['name'], e)
+                        continue
+                    if test_content:
+                        # Save the test file
+                        success = self._save_file(flow['filename'], test_content)
+                        if success:
+                            test_files.append(flow['filename'])
+                            logger.info("Successfully generated test file: %s", flow['filename'])
+                        else:
+                            logger.error("Failed to save test file: %s", flow['filename'])
                     else:
-                        self._log_activity(f"Failed to save test file: {flow['filename']}", "ERROR")
-                else:
-                    self._log_activity(f"Failed to generate test content for: {flow['name']}", "ERROR")
-            
-            self._log_activity(f"Generated {len(test_files)} test files from {len(user_flows)} user flows")
+                        logger.error("Failed to generate test content for: %s", flow['name'])
             
+            logger.info("Generated %d test files from %d user flows", len(test_files), len(user_flows))
+
+            # Flush all staged test content to disk in one batch before
+            # validation reads it back
+            self._flush_test_files()
+
             # Step 7: Validate tests
             print("\n✅ STEP 7: VALIDATING TESTS")
             print("-" * 40)
-            self._log_activity("STEP 7: VALIDATING TESTS", "STEP")
+            logger.log(STEP, "STEP 7: VALIDATING TESTS")
             validation_results = self._validate_tests(test_files)
-            self._log_activity(f"Test validation completed: {validation_results}")
+            logger.info("Test validation completed: %s", validation_results)
             
             # Step 8: Generate comprehensive report
             print("\n📊 STEP 8: GENERATING COMPREHENSIVE REPORT")
             print("-" * 40)
-            self._log_activity("STEP 8: GENERATING COMPREHENSIVE REPORT", "STEP")
+            logger.log(STEP, "STEP 8: GENERATING COMPREHENSIVE REPORT")
             report = self._generate_comprehensive_report(app_analysis, validation_results)
             self._save_report(report)
-            self._log_activity(f"Comprehensive report generated and saved: {len(report)} characters")
+            logger.info("Comprehensive report generated and saved: %d characters", len(report))
             
             print("\n🎉 Test generation completed successfully!")
             print(f"Framework: {self.framework}")
             print(f"Files analyzed: {len(self.files)}")
-            print(f"Dependency graph nodes: {len(graph.nodes())}")
+            print(f"Dependency graph nodes: {graph.num_nodes()}")
             print(f"Generated {len(test_files)} test files")
             print(f"Analysis report: {os.path.join(RUN_DIR, 'reports', 'analysis_report.md')}")
             print(f"Graphviz file: {os.path.join(RUN_DIR, 'code_graph.dot')}")
             print(f"Run directory: {RUN_DIR}")
             
-            self._log_activity("Test generation completed successfully", "SUCCESS")
-            self._log_activity(f"Final results: {len(test_files)} test files, {len(self.files)} files analyzed", "SUCCESS")
-            self._log_activity(f"All files saved in run directory: {RUN_DIR}", "SUCCESS")
+            logger.log(SUCCESS, "Test generation completed successfully")
+            logger.log(SUCCESS, "Final results: %d test files, %d files analyzed", len(test_files), len(self.files))
+            logger.log(SUCCESS, "All files saved in run directory: %s", RUN_DIR)
             
             return {
                 "success": True,
@@ -392,12 +1007,14 @@ test.describe('{flow_name}', () => {{
         except Exception as e:
             error_msg = f"Error during test generation: {str(e)}"
             print(f"❌ {error_msg}")
-            self._log_activity(error_msg, "ERROR")
+            logger.error(error_msg)
             import traceback
-            self._log_activity(f"Traceback: {traceback.format_exc()}", "ERROR")
+            logger.error("Traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
         
         finally:
+            self.session.close()
+            self._close_activity_log()
             self._cleanup_temp_directory()
     
     def _clone_repository(self, repo_url: str) -> str:
@@ -440,54 +1057,71 @@ test.describe('{flow_name}', () => {{
         """Detect the frontend framework"""
         print("🔄 Detecting frontend framework")
         
-        # Look for package.json files recursively
+        # The framework signal lives in the root (or workspace) package.json,
+        # so only look at the repo root plus one directory level down instead
+        # of walking the whole tree
         package_files = []
-        for root, dirs, files in os.walk(self.temp_dir):
-            if 'package.json' in files:
-                package_files.append(os.path.join(root, 'package.json'))
+        root_pkg = os.path.join(self.temp_dir, 'package.json')
+        if os.path.isfile(root_pkg):
+            package_files.append(root_pkg)
+        try:
+            for entry in sorted(os.listdir(self.temp_dir)):
+                if entry in _SKIP_DIRS:
+                    continue
+                candidate = os.path.join(self.temp_dir, entry, 'package.json')
+                if os.path.isfile(candidate):
+                    package_files.append(candidate)
+        except OSError as e:
+            print(f"⚠️ Error listing {self.temp_dir}: {e}")
         
         framework_scores = {'react': 0, 'vue': 0, 'angular': 0, 'svelte': 0}
         
         for package_file in package_files:
             print(f"ℹ️ Found package.json: {package_file}")
             try:
-                with open(package_file, 'r') as f:
-                    package_data = json.load(f)
-                    dependencies = package_data.get('dependencies', {})
-                    dev_dependencies = package_data.get('devDependencies', {})
-                    all_deps = {**dependencies, **dev_dependencies}
-                    
-                    print(f"📊 Dependencies in package.json: {list(all_deps.keys())[:10]}")
-                    
-                    # Check for framework indicators
-                    if 'react' in all_deps:
-                        framework_scores['react'] += 1
-                        print(f"ℹ️ Found react in package.json -> react")
-                    if 'react-dom' in all_deps:
-                        framework_scores['react'] += 1
-                        print(f"ℹ️ Found react-dom in package.json -> react")
-                    if '@types/react' in all_deps:
-                        framework_scores['react'] += 1
-                        print(f"ℹ️ Found @types/react in package.json -> react")
+                package_data = orjson.loads(Path(package_file).read_bytes())
+                dependencies = package_data.get('dependencies', {})
+                dev_dependencies = package_data.get('devDependencies', {})
+                all_deps = {**dependencies, **dev_dependencies}
                     
-                    if 'vue' in all_deps:
-                        framework_scores['vue'] += 1
-                    if '@vue/cli-service' in all_deps:
-                        framework_scores['vue'] += 1
-                    
-                    if '@angular/core' in all_deps:
-                        framework_scores['angular'] += 1
-                    if '@angular/cli' in all_deps:
-                        framework_scores['angular'] += 1
+                print(f"📊 Dependencies in package.json: {list(all_deps.keys())[:10]}")
+                
+                # Check for framework indicators
+                if 'react' in all_deps:
+                    framework_scores['react'] += 1
+                    print(f"ℹ️ Found react in package.json -> react")
+                if 'react-dom' in all_deps:
+                    framework_scores['react'] += 1
+                    print(f"ℹ️ Found react-dom in package.json -> react")
+                if '@types/react' in all_deps:
+                    framework_scores['react'] += 1
+                    print(f"ℹ️ Found @types/react in package.json -> react")
+                
+                if 'vue' in all_deps:
+                    framework_scores['vue'] += 1
+                if '@vue/cli-service' in all_deps:
+                    framework_scores['vue'] += 1
+                
+                if '@angular/core' in all_deps:
+                    framework_scores['angular'] += 1
+                if '@angular/cli' in all_deps:
+                    framework_scores['angular'] += 1
+                
+                if 'svelte' in all_deps:
+                    framework_scores['svelte'] += 1
+                if 'svelte-preprocess' in all_deps:
+                    framework_scores['svelte'] += 1
                     
-                    if 'svelte' in all_deps:
-                        framework_scores['svelte'] += 1
-                    if 'svelte-preprocess' in all_deps:
-                        framework_scores['svelte'] += 1
-                        
             except Exception as e:
                 print(f"⚠️ Error reading package.json: {e}")
-        
+
+            # Stop parsing further package.json files once one framework is
+            # decisively ahead (score >= 2 with no competing signal)
+            top = max(framework_scores, key=framework_scores.get)
+            if framework_scores[top] >= 2 and sum(framework_scores.values()) == framework_scores[top]:
+                print(f"ℹ️ Decisive framework signal ({top}), skipping remaining package.json files")
+                break
+
         print(f"📊 Framework detection scores: {framework_scores}")
         print(f"📊 Package files found: {package_files}")
         
@@ -503,86 +1137,122 @@ test.describe('{flow_name}', () => {{
         print("🔄 Collecting frontend source files")
         
         files = []
-        extensions = ['.tsx', '.jsx', '.js', '.ts', '.vue', '.html']
-        
-        for ext in extensions:
-            print(f"ℹ️ Scanning for {ext} files")
-            for root, dirs, filenames in os.walk(self.temp_dir):
-                for filename in filenames:
-                    if filename.endswith(ext):
-                        file_path = os.path.join(root, filename)
-                        file_size = os.path.getsize(file_path)
-                        
-                        # Skip very large files (allow larger files for router files)
-                        is_router_file = any(keyword in filename.lower() for keyword in ['appshell', 'router', 'routes', 'app'])
-                        max_size = MAX_FILE_SIZE * 3 if is_router_file else MAX_FILE_SIZE
-                        
-                        if file_size > max_size:
-                            print(f"⚠️ Skipped {filename} - too large ({file_size} bytes > {max_size})")
-                            continue
-                        
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                files.append(file_path)
-                                print(f"ℹ️ Collected: {filename} ({file_size} bytes, {len(content)} chars)")
-                        except Exception as e:
-                            print(f"⚠️ Could not read {filename}: {e}")
+        extensions = ('.tsx', '.jsx', '.js', '.ts', '.vue', '.html')
+        print(f"ℹ️ Scanning for {', '.join(extensions)} files")
+
+        # One walk over the tree, filtering by extension per entry, instead of
+        # a full traversal per extension; prune heavy directories in-place
+        for root, dirs, filenames in os.walk(self.temp_dir):
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            for filename in filenames:
+                if filename.endswith(extensions):
+                    file_path = os.path.join(root, filename)
+                    file_size = os.path.getsize(file_path)
+
+                    # Skip very large files (allow larger files for router files)
+                    is_router_file = any(keyword in filename.lower() for keyword in ['appshell', 'router', 'routes', 'app'])
+                    max_size = CFG.max_file_size * 3 if is_router_file else CFG.max_file_size
+
+                    if file_size > max_size:
+                        print(f"⚠️ Skipped {filename} - too large ({file_size} bytes > {max_size})")
+                        continue
+
+                    try:
+                        content = _slurp(file_path)
+                        files.append(file_path)
+                        self.file_contents[file_path] = content
+                        print(f"ℹ️ Collected: {filename} ({file_size} bytes, {len(content)} chars)")
+                    except Exception as e:
+                        print(f"⚠️ Could not read {filename}: {e}")
         
         print(f"✅ File collection complete: {len(files)} files collected")
         return files
-    
+
+    def _get_buffer(self) -> list:
+        """Take a chunk buffer from the pool, or make a fresh one if more
+        workers are active than the pool was sized for"""
+        try:
+            return self._buf_pool.get_nowait()
+        except queue.Empty:
+            return []
+
+    def _read(self, file_path: str) -> str:
+        """Return file content from the in-memory cache, reading from disk
+        only on a miss so each file hits the filesystem at most once"""
+        try:
+            return self.file_contents[file_path]
+        except KeyError:
+            # Cache misses are files that collection skipped, so bound them
+            # by the same allowance router files get during collection
+            content = _slurp(file_path, limit=CFG.max_file_size * 3)
+            self.file_contents[file_path] = content
+            return content
+
+
     def _build_dependency_graph(self, files: List[str]) -> tuple:
         """Build dependency graph and classify files"""
         print("🔄 Building dependency graph and classifying files")
         print(f"ℹ️ Processing {len(files)} files for graph construction")
         
-        graph = nx.DiGraph()
+        # rustworkx addresses nodes by integer index, so keep a filename ->
+        # index map alongside the graph
+        graph = rx.PyDiGraph(multigraph=False)
+        node_idx = {}
         file_roles = {}
         route_map = {}
-        
-        for file_path in files:
-            filename = os.path.basename(file_path)
+
+        # Per-file read + regex scan is independent work, so fan it out to a
+        # process pool; the graph itself is mutated only on the main thread.
+        # Contents were already read (and decoded) during collection, so hand
+        # them to the workers instead of hitting the disk a second time.
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_analyze_file, files,
+                                        (self.file_contents.get(f) for f in files),
+                                        chunksize=32))
+
+        # O(1) membership test for import targets instead of rebuilding a
+        # basename list per import
+        basename_set = {os.path.basename(f) for f in files}
+
+        for result in results:
+            filename = result['filename']
             print(f"ℹ️ Processing: {filename}")
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract imports
-                imports = self._extract_imports(content)
-                print(f"📊 Imports in {filename}: {imports[:5]}")
-                
-                # Add node to graph
-                graph.add_node(filename)
-                
-                # Add edges for imports
-                for imp in imports:
-                    if imp.endswith(('.tsx', '.jsx', '.ts', '.js')):
-                        target_file = os.path.basename(imp)
-                        if target_file in [os.path.basename(f) for f in files]:
-                            graph.add_edge(filename, target_file)
-                            print(f"ℹ️ Added edge: {filename} -> {target_file}")
-                
-                # Classify file role
-                role = self._classify_file_role(filename, content, imports)
-                file_roles[filename] = role
-                
-                # Extract routes
-                routes = self._extract_routes(content)
-                if routes:
-                    route_map[filename] = routes
-                    print(f"ℹ️ Route file: {filename} -> routes: {routes}")
-                
-                if role == 'Component':
-                    print(f"ℹ️ Component file: {filename}")
-                elif role == 'API':
-                    print(f"ℹ️ API file: {filename}")
-                
-            except Exception as e:
-                print(f"⚠️ Error processing {filename}: {e}")
-        
-        print(f"✅ Dependency graph built: {len(graph.nodes())} nodes, {len(graph.edges())} edges")
+
+            if result['error']:
+                print(f"⚠️ Error processing {filename}: {result['error']}")
+                continue
+
+            imports = result['imports']
+            routes = result['routes']
+            print(f"📊 Imports in {filename}: {imports[:5]}")
+
+            # Add node to graph
+            if filename not in node_idx:
+                node_idx[filename] = graph.add_node(filename)
+
+            # Add edges for imports
+            for imp in imports:
+                if imp.endswith(('.tsx', '.jsx', '.ts', '.js')):
+                    target_file = os.path.basename(imp)
+                    if target_file in basename_set:
+                        if target_file not in node_idx:
+                            node_idx[target_file] = graph.add_node(target_file)
+                        graph.add_edge(node_idx[filename], node_idx[target_file], None)
+                        print(f"ℹ️ Added edge: {filename} -> {target_file}")
+
+            role = result['role']
+            file_roles[filename] = role
+
+            if routes:
+                route_map[filename] = routes
+                print(f"ℹ️ Route file: {filename} -> routes: {routes}")
+
+            if role == 'Component':
+                print(f"ℹ️ Component file: {filename}")
+            elif role == 'API':
+                print(f"ℹ️ API file: {filename}")
+        
+        print(f"✅ Dependency graph built: {graph.num_nodes()} nodes, {graph.num_edges()} edges")
         print(f"📊 File roles distribution: {dict(sorted(file_roles.items(), key=lambda x: x[1]))}")
         print(f"📊 Route mapping: {route_map}")
         return graph, file_roles, route_map
@@ -590,88 +1260,21 @@ test.describe('{flow_name}', () => {{
     def _extract_imports(self, content: str) -> List[str]:
         """Extract import statements from file content"""
         imports = []
-        
-        # Match various import patterns
-        patterns = [
-            r"import\s+.*?\s+from\s+['\"]([^'\"]+)['\"]",
-            r"import\s+['\"]([^'\"]+)['\"]",
-            r"require\(['\"]([^'\"]+)['\"]\)",
-            r"from\s+['\"]([^'\"]+)['\"]"
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content)
-            imports.extend(matches)
-        
+
+        for pattern in _IMPORT_PATTERNS:
+            imports.extend(pattern.findall(content))
+
         return list(set(imports))
     
-    def _classify_file_role(self, filename: str, content: str, imports: List[str]) -> str:
-        """Classify file role based on content and imports"""
-        filename_lower = filename.lower()
-        content_lower = content.lower()
-        
-        # Route files
-        if 'route' in filename_lower or 'router' in filename_lower:
-            return 'Route'
-        
-        # API files
-        if 'api' in filename_lower or 'service' in filename_lower:
-            return 'API'
-        
-        # Component files
-        if any(ext in filename_lower for ext in ['.tsx', '.jsx', '.vue']):
-            return 'Component'
-        
-        # Form files
-        if 'form' in filename_lower or 'input' in filename_lower:
-            return 'Form'
-        
-        return 'Other'
-    
     def _extract_routes(self, content: str) -> List[str]:
         """Extract route patterns from content, focusing on React Router configurations"""
         routes = []
-        
-        # React Router specific patterns - prioritize these
-        react_router_patterns = [
-            # <Route path="/dashboard" element={<Dashboard />} />
-            r'<Route\s+path=["\']([^"\']+)["\']',
-            # <Route path="/dashboard" element={<Dashboard />} />
-            r'path=["\']([^"\']+)["\']\s+element=',
-            # Navigate to="/dashboard"
-            r'<Navigate\s+to=["\']([^"\']+)["\']',
-            # navigate("/dashboard")
-            r'navigate\(["\']([^"\']+)["\']\)',
-            # href="/dashboard"
-            r'href=["\']([^"\']+)["\']',
-            # to="/dashboard"
-            r'to=["\']([^"\']+)["\']'
-        ]
-        
-        # Extract routes using React Router patterns first
-        for pattern in react_router_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            routes.extend(matches)
-        
-        # Filter out invalid routes and clean up
-        valid_routes = []
-        for route in routes:
-            # Skip routes that are clearly not valid paths
-            if (route.startswith('/') and 
-                not route.startswith('//') and 
-                not route.startswith('/api/') and
-                not route.startswith('http') and
-                not route.startswith('mailto:') and
-                not route.startswith('tel:') and
-                len(route) > 1 and
-                not route.endswith('.css') and
-                not route.endswith('.js') and
-                not route.endswith('.png') and
-                not route.endswith('.jpg') and
-                not route.endswith('.ico')):
-                valid_routes.append(route)
-        
-        return list(set(valid_routes))
+
+        # Extract routes using the pre-compiled React Router patterns
+        for pattern in _ROUTE_PATTERNS:
+            routes.extend(pattern.findall(content))
+
+        return _filter_valid_routes(routes)
     
     def _extract_react_router_routes(self) -> Dict[str, str]:
         """Extract routes specifically from React Router configuration files"""
@@ -688,8 +1291,7 @@ test.describe('{flow_name}', () => {{
         # Also look for files that might contain Routes configuration (even if large)
         for file_path in self.files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._read(file_path)
                 # Check if file contains React Router Routes
                 if '<Routes>' in content and '<Route' in content:
                     if file_path not in router_files:
@@ -713,10 +1315,9 @@ test.describe('{flow_name}', () => {{
                 file_size = os.path.getsize(file_path)
                 if file_size > 10000:
                     print(f"📁 Reading large router file: {os.path.basename(file_path)} ({file_size} bytes)")
-                
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
+
+                content = self._read(file_path)
+
                 # Look for <Routes> and <Route> patterns with better regex
                 # Pattern 1: <Route path="/dashboard" element={<ProtectedRoute><Dashboard /></ProtectedRoute>} />
                 routes_pattern1 = r'<Route\s+path=["\']([^"\']+)["\']\s+element=\{[^}]*?<(\w+)\s*/>'
@@ -759,14 +1360,19 @@ test.describe('{flow_name}', () => {{
         print(f"✅ Extracted {len(router_routes)} routes from React Router configuration")
         return router_routes
     
-    def _export_graphviz(self, graph: nx.DiGraph, file_roles: Dict[str, str]):
+    def _export_graphviz(self, graph: rx.PyDiGraph, file_roles: Dict[str, str]):
         """Export dependency graph to Graphviz format"""
         print("🔄 Exporting dependency graph to Graphviz format")
         
-        dot_content = "digraph CodeDependency {\n"
-        dot_content += "  rankdir=TB;\n"
-        dot_content += "  node [shape=box, style=filled];\n\n"
-        
+        # Accumulate fragments and join once - += on a growing string is
+        # quadratic for graphs with many nodes/edges
+        parts = [
+            'digraph CodeDependency {',
+            '  rankdir=TB;',
+            '  node [shape=box, style=filled];',
+            ''
+        ]
+
         # Add nodes with colors based on roles
         role_colors = {
             'Component': 'lightblue',
@@ -775,50 +1381,52 @@ test.describe('{flow_name}', () => {{
             'Form': 'lightyellow',
             'Other': 'lightgray'
         }
-        
+
         for node in graph.nodes():
             role = file_roles.get(node, 'Other')
             color = role_colors.get(role, 'lightgray')
-            dot_content += f'  "{node}" [fillcolor={color}, label="{node}\\n({role})"];\n'
-        
-        dot_content += "\n"
-        
-        # Add edges
-        for edge in graph.edges():
-            dot_content += f'  "{edge[0]}" -> "{edge[1]}";\n'
-        
-        dot_content += "}\n"
-        
+            parts.append(f'  "{node}" [fillcolor={color}, label="{node}\\n({role})"];')
+
+        parts.append('')
+
+        # Add edges (edge_list yields index pairs; payloads are the filenames)
+        for source, target in graph.edge_list():
+            parts.append(f'  "{graph.get_node_data(source)}" -> "{graph.get_node_data(target)}";')
+
+        parts.append('}')
+
         # Save graphviz file in the run directory
         graphviz_file = os.path.join(RUN_DIR, "code_graph.dot")
         with open(graphviz_file, 'w') as f:
-            f.write(dot_content)
+            f.write('\n'.join(parts) + '\n')
         
-        print(f"✅ Graphviz export complete: {len(graph.nodes())} nodes, {len(graph.edges())} edges")
+        print(f"✅ Graphviz export complete: {graph.num_nodes()} nodes, {graph.num_edges()} edges")
         print(f"ℹ️ Graph saved to {graphviz_file}")
         print(f"ℹ️ To visualize: dot -Tpng {graphviz_file} -o {os.path.join(RUN_DIR, 'code_graph.png')}")
     
     def _format_key_pages(self) -> str:
         """Format key pages for the prompt"""
         key_pages = []
-        for filename, role in self.file_roles.items():
-            if 'Page' in filename and role == 'Component':
+        for filename in self._roles_index.get('Component', ()):
+            if 'Page' in filename:
                 key_pages.append(f"- {filename}")
         return "\n".join(key_pages[:10]) if key_pages else "- No specific pages detected"
     
     def _get_sample_components(self) -> str:
         """Get sample component code for context"""
         sample_components = []
-        for file_path in self.files:
-            filename = os.path.basename(file_path)
-            if self.file_roles.get(filename) == 'Component' and len(sample_components) < 3:
-                if 'Page' in filename:  # Prioritize page components
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()[:800]  # First 800 chars
-                            sample_components.append(f"{filename}:\n{content[:800]}")
-                    except:
-                        pass
+        for filename in self._roles_index.get('Component', ()):
+            if len(sample_components) >= 3:
+                break
+            if 'Page' in filename:  # Prioritize page components
+                file_path = self._path_by_name.get(filename)
+                if not file_path:
+                    continue
+                try:
+                    content = self._read(file_path)[:800]  # First 800 chars
+                    sample_components.append(f"{filename}:\n{content}")
+                except:
+                    pass
         return "\n\n".join(sample_components) if sample_components else "No sample components available"
     
     def _build_comprehensive_prompt(self, analysis: Dict[str, Any] = None, user_flows_content: str = "") -> str:
@@ -826,34 +1434,38 @@ test.describe('{flow_name}', () => {{
         print("🔄 Building comprehensive prompt with advanced analysis")
         
         # Get component information
-        component_files = [f for f, role in self.file_roles.items() if role == 'Component']
-        api_files = [f for f, role in self.file_roles.items() if role == 'API']
-        form_files = [f for f, role in self.file_roles.items() if role == 'Form']
+        component_files = self._roles_index.get('Component', [])
+        api_files = self._roles_index.get('API', [])
+        form_files = self._roles_index.get('Form', [])
         
-        # Use comprehensive analysis if available
+        # Use comprehensive analysis if available; feed generator expressions
+        # straight to join so no intermediate bullet lists are materialized
         if analysis:
-            routes_list = "\n".join([f"- {route}" for route in analysis.get('routes', [])[:15]])
-            pages_list = "\n".join([f"- {page}" for page in analysis.get('pages', [])[:15]])
-            api_endpoints_list = "\n".join([f"- {endpoint}" for endpoint in analysis.get('api_endpoints', [])[:10]])
-            features_list = "\n".join([f"- {feature}" for feature in analysis.get('features', [])])
-            user_flows_list = "\n".join([f"- {flow}" for flow in analysis.get('user_flows', [])[:10]])
+            routes_list = "\n".join(f"- {route}" for route in analysis.get('routes', [])[:15])
+            pages_list = "\n".join(f"- {page}" for page in analysis.get('pages', [])[:15])
+            api_endpoints_list = "\n".join(f"- {endpoint}" for endpoint in analysis.get('api_endpoints', [])[:10])
+            features_list = "\n".join(f"- {feature}" for feature in analysis.get('features', []))
+            user_flows_list = "\n".join(f"- {flow}" for flow in analysis.get('user_flows', [])[:10])
             sample_routes = analysis.get('routes', [])[:8]
         else:
             # Fallback to basic analysis
             sample_routes = list(set(self.route_map.keys()))[:8]
-            routes_list = "\n".join([f"- {route}" for route in sample_routes])
-            pages_list = "\n".join([f"- {f}" for f in component_files[:15]])
+            routes_list = "\n".join(f"- {route}" for route in sample_routes)
+            pages_list = "\n".join(f"- {f}" for f in component_files[:15])
             api_endpoints_list = "No API endpoints detected"
             features_list = "Basic application functionality"
             user_flows_list = "Standard user flows"
-        
+
         # Get key components list
-        key_components_list = "\n".join([f"- {f}" for f in component_files[:15]])
+        key_components_list = "\n".join(f"- {f}" for f in component_files[:15])
         
         # Get sample component code
         sample_code = self._get_sample_components()
         
-        prompt = f"""
+        # Assemble the prompt from parts joined once: the dynamic head is one
+        # small f-string, the long requirements tail is a plain literal that
+        # never goes through the f-string formatter
+        parts = [f"""
 You are an expert QA automation engineer. Generate COMPREHENSIVE Playwright tests for this {self.framework.upper()} application.
 
 FRAMEWORK: {self.framework.upper()}
@@ -889,7 +1501,8 @@ KEY COMPONENTS:
 SAMPLE COMPONENT CODE:
 {sample_code}
 
-CRITICAL REQUIREMENTS:
+"""]
+        parts.append("""CRITICAL REQUIREMENTS:
 1. **MOST IMPORTANT: Generate tests based EXACTLY on the "DETAILED USER FLOW DESCRIPTIONS" provided above.**
    - Use the specific routes, components, UI elements, and steps from each flow
    - Use the exact button text, input placeholders, and API endpoints mentioned
@@ -906,27 +1519,27 @@ CRITICAL REQUIREMENTS:
 4. Use this EXACT format for each file:
 filename.spec.ts:
 ```typescript
-import {{ test, expect }} from '@playwright/test';
+import { test, expect } from '@playwright/test';
 
-test.describe('Category Name', () => {{
-  test('should perform specific comprehensive test', async ({{ page }}) => {{
+test.describe('Category Name', () => {
+  test('should perform specific comprehensive test', async ({ page }) => {
     await page.goto('/route');
-    await page.route('**/api/endpoint', route => route.fulfill({{
+    await page.route('**/api/endpoint', route => route.fulfill({
       status: 200,
       contentType: 'application/json',
-      body: JSON.stringify({{ data: 'mock' }})
-    }}));
+      body: JSON.stringify({ data: 'mock' })
+    }));
     await expect(page.locator('real-selector')).toBeVisible();
     await page.click('button[data-testid="specific-button"]');
     await expect(page.locator('.result')).toContainText('expected text');
-  }});
+  });
   
-  test('should handle edge case scenario', async ({{ page }}) => {{
+  test('should handle edge case scenario', async ({ page }) => {
     // Detailed edge case testing
-  }});
+  });
   
   // More comprehensive test cases...
-}});
+});
 ```
 
 4. REQUIREMENTS FOR EACH TEST TYPE:
@@ -967,7 +1580,7 @@ ACCESSIBILITY TESTS (accessibility.spec.ts):
 - Ensure all buttons/links are keyboard accessible
 
 5. TECHNICAL REQUIREMENTS:
-- Use ES6 imports: import {{ test, expect }} from '@playwright/test'
+- Use ES6 imports: import { test, expect } from '@playwright/test'
 - Mock ALL API calls with page.route() and realistic JSON responses
 - Use realistic selectors: input[type="email"], button[type="submit"], [data-testid="..."]
 - Include proper error handling and edge cases
@@ -982,15 +1595,14 @@ ACCESSIBILITY TESTS (accessibility.spec.ts):
    - DO NOT generate generic login/authentication tests - use the specific flows provided
 
 Generate comprehensive, production-ready test cases now:
-"""
+""")
+        prompt = "".join(parts)
         
         print(f"✅ Prompt built successfully ({len(prompt)} characters)")
         
         # Save the full prompt to a file for testing with ChatGPT
         prompt_file = f"{LOG_DIR}/ollama_prompt_{self.run_timestamp}.txt"
-        os.makedirs(LOG_DIR, exist_ok=True)
-        with open(prompt_file, 'w', encoding='utf-8') as f:
-            f.write(prompt)
+        Path(prompt_file).write_text(prompt, encoding='utf-8')
         print(f"📝 Full prompt saved to: {prompt_file}")
         
         return prompt
@@ -998,25 +1610,27 @@ Generate comprehensive, production-ready test cases now:
     def _ask_ollama_single_file(self, base_prompt: str, test_type: str, test_filename: str) -> str:
         """Generate a single test file with focused prompt"""
         
-        # Build focused prompt for single file
-        focused_prompt = f"{base_prompt}\n\n**CRITICAL: Generate ONLY {test_filename} with 6-8 comprehensive test cases based on the user flows provided above.**\n\n**REQUIRED OUTPUT FORMAT - COPY THIS EXACTLY:**\n{test_filename}:\n```typescript\nimport {{ test, expect }} from '@playwright/test';\n\n[Your complete test code here - MUST be complete and valid TypeScript]\n```\n\n**IMPORTANT:** \n1. Start your response with exactly: {test_filename}:\n2. Provide COMPLETE TypeScript code in a markdown code block\n3. Use the specific user flows from the DETAILED USER FLOW DESCRIPTIONS above\n4. Include proper imports, test structure, and assertions\n5. Make sure the code is syntactically correct and complete\n6. DO NOT truncate or leave incomplete code"
-        
-        print(f"🔄 Generating {test_filename} (model: {OLLAMA_MODEL})")
+        # Build focused prompt for single file: keep the per-file suffix
+        # separate so only it needs to be dumped to the logs below
+        focused_suffix = f"\n\n**CRITICAL: Generate ONLY {test_filename} with 6-8 comprehensive test cases based on the user flows provided above.**\n\n**REQUIRED OUTPUT FORMAT - COPY THIS EXACTLY:**\n{test_filename}:\n```typescript\nimport {{ test, expect }} from '@playwright/test';\n\n[Your complete test code here - MUST be complete and valid TypeScript]\n```\n\n**IMPORTANT:** \n1. Start your response with exactly: {test_filename}:\n2. Provide COMPLETE TypeScript code in a markdown code block\n3. Use the specific user flows from the DETAILED USER FLOW DESCRIPTIONS above\n4. Include proper imports, test structure, and assertions\n5. Make sure the code is syntactically correct and complete\n6. DO NOT truncate or leave incomplete code"
+        focused_prompt = base_prompt + focused_suffix
+
+        print(f"🔄 Generating {test_filename} (model: {CFG.ollama_model})")
         print(f"ℹ️ Prompt length: {len(focused_prompt)} characters")
-        self._log_activity(f"Generating {test_filename} with {len(focused_prompt)} character prompt")
-        
-        # Save individual file prompt to logs
-        individual_prompt_file = f"{LOG_DIR}/ollama_prompt_{self.run_timestamp}_{test_filename.replace('.spec.ts', '')}.txt"
-        os.makedirs(LOG_DIR, exist_ok=True)
-        with open(individual_prompt_file, 'w', encoding='utf-8') as f:
-            f.write(focused_prompt)
-        print(f"📝 Individual prompt saved to: {individual_prompt_file}")
-        self._log_activity(f"Individual prompt saved: {individual_prompt_file}")
+        logger.info("Generating %s with %d character prompt", test_filename, len(focused_prompt))
+
+        # Save only the per-file suffix: the shared base prompt is already in
+        # ollama_base_prompt_{ts}.txt, so re-writing it per file would copy
+        # the same bytes to disk four times
+        individual_prompt_file = f"{LOG_DIR}/ollama_prompt_suffix_{self.run_timestamp}_{test_filename.replace('.spec.ts', '')}.txt"
+        Path(individual_prompt_file).write_text(focused_suffix, encoding='utf-8')
+        print(f"📝 Individual prompt suffix saved to: {individual_prompt_file}")
+        logger.info("Individual prompt suffix saved: %s", individual_prompt_file)
         
         request_data = {
-            'model': OLLAMA_MODEL,
+            'model': CFG.ollama_model,
             'prompt': focused_prompt,
-            'stream': False,
+            'stream': True,
             'options': {
                 'num_predict': 5000,  # Increased for complete test files
                 'temperature': 0.7,
@@ -1024,50 +1638,63 @@ Generate comprehensive, production-ready test cases now:
                 'top_k': 40
             }
         }
-        
+
         try:
-            response = requests.post(
-                OLLAMA_API_URL,
-                json=request_data,
+            response = self.session.post(
+                CFG.ollama_api_url,
+                data=orjson.dumps(request_data),
+                headers={'Content-Type': 'application/json'},
+                stream=True,
                 timeout=120
             )
-            
+
             if response.status_code == 200:
-                result = response.json()
-                response_text = result.get('response', '')
-                print(f"✅ Generated {test_filename}: {len(response_text)} characters")
-                self._log_activity(f"Generated {test_filename}: {len(response_text)} characters")
-                
-                # Save response to logs
+                # Stream the NDJSON response: append each chunk to the log
+                # file as it arrives instead of buffering one large string
                 response_file = f"{LOG_DIR}/ollama_response_{self.run_timestamp}_{test_filename.replace('.spec.ts', '')}.txt"
-                with open(response_file, 'w', encoding='utf-8') as f:
-                    f.write(response_text)
+                parts = self._get_buffer()
+                try:
+                    with open(response_file, 'w', encoding='utf-8') as log_file:
+                        for line in response.iter_lines(decode_unicode=False):
+                            if not line:
+                                continue
+                            chunk = orjson.loads(line)
+                            piece = chunk.get('response', '')
+                            if piece:
+                                parts.append(piece)
+                                log_file.write(piece)
+                            if chunk.get('done'):
+                                break
+                    response_text = "".join(parts)
+                finally:
+                    parts.clear()
+                    self._buf_pool.put(parts)
+                print(f"✅ Generated {test_filename}: {len(response_text)} characters")
+                logger.info("Generated %s: %d characters", test_filename, len(response_text))
                 print(f"📝 Response saved to: {response_file}")
-                self._log_activity(f"Response saved: {response_file}")
-                
+                logger.info("Response saved: %s", response_file)
+
                 return response_text
             else:
                 error_msg = f"Ollama request failed: {response.status_code}"
                 print(f"❌ {error_msg}")
-                self._log_activity(error_msg, "ERROR")
+                logger.error(error_msg)
                 return ""
         except Exception as e:
             error_msg = f"Error calling Ollama: {e}"
             print(f"❌ {error_msg}")
-            self._log_activity(error_msg, "ERROR")
+            logger.error(error_msg)
             return ""
     
     def _ask_ollama(self, prompt: str) -> str:
         """Send prompt to Ollama and get response - generates one file at a time"""
-        print(f"🔄 Sending prompts to Ollama (model: {OLLAMA_MODEL})")
+        print(f"🔄 Sending prompts to Ollama (model: {CFG.ollama_model})")
         print(f"ℹ️ Base prompt length: {len(prompt)} characters")
         print("ℹ️ Strategy: Generating each test file individually for better quality")
         
         # Save base prompt
         prompt_file = f"{LOG_DIR}/ollama_base_prompt_{self.run_timestamp}.txt"
-        os.makedirs(LOG_DIR, exist_ok=True)
-        with open(prompt_file, 'w', encoding='utf-8') as f:
-            f.write(prompt)
+        Path(prompt_file).write_text(prompt, encoding='utf-8')
         print(f"📝 Base prompt saved to: {prompt_file}")
         
         # Generate each file individually
@@ -1078,18 +1705,30 @@ Generate comprehensive, production-ready test cases now:
             ('accessibility.spec.ts', 'Accessibility Tests')
         ]
         
-        combined_response = ""
+        # The four generations are independent Ollama calls, so run them
+        # concurrently and reassemble in the original file order
+        responses = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {executor.submit(self._ask_ollama_single_file, prompt, description, filename): filename
+                       for filename, description in test_files}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    responses[filename] = future.result()
+                except Exception as e:
+                    print(f"⚠️ Warning: Generation raised for {filename}: {e}")
+                    responses[filename] = ""
+
+        chunks = []
         for filename, description in test_files:
-            print(f"\n{'='*60}")
-            print(f"📝 Generating: {filename} ({description})")
-            print(f"{'='*60}")
-            
-            file_response = self._ask_ollama_single_file(prompt, description, filename)
+            file_response = responses.get(filename, "")
             if file_response:
                 # Add to combined response with clear separator
-                combined_response += f"\n\n{filename}:\n{file_response}\n"
+                chunks.append(f"\n\n{filename}:\n{file_response}\n")
             else:
                 print(f"⚠️ Warning: Failed to generate {filename}")
+
+        combined_response = "".join(chunks)
         
         print(f"\n{'='*60}")
         print(f"✅ All files generated: {len(combined_response)} total characters")
@@ -1102,22 +1741,24 @@ Generate comprehensive, production-ready test cases now:
         print("🔄 Parsing and saving test files from Ollama response")
         print(f"📊 Raw test response: {response_text[:500]}...")
         
-        os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
         files_saved = []
-        
+        seen = set()
+
         print(f"ℹ️ Processing {len(response_text.splitlines())} lines of response")
-        
-        # Try multiple parsing strategies
-        files_saved.extend(self._parse_filename_format(response_text))
-        files_saved.extend(self._parse_hash_format(response_text))
-        files_saved.extend(self._parse_markdown_format(response_text))
-        
-        # If we still don't have the expected files, try to map based on content
-        if len(files_saved) < 4:
-            files_saved.extend(self._parse_by_content_mapping(response_text))
-        
-        # Remove duplicates while preserving order
-        files_saved = list(dict.fromkeys(files_saved))
+
+        # Try the parsing strategies in ranked order, stopping as soon as the
+        # four expected files are on disk; each later strategy would only
+        # re-scan the full response for files we already have
+        strategies = (
+            self._parse_filename_format,
+            self._parse_hash_format,
+            self._parse_markdown_format,
+            self._parse_by_content_mapping,
+        )
+        for strategy in strategies:
+            files_saved.extend(strategy(response_text, seen))
+            if _EXPECTED_TEST_FILES.issubset(seen):
+                break
         
         print(f"✅ Test file parsing complete: {len(files_saved)} files saved")
         print(f"📊 Files saved: {files_saved}")
@@ -1129,116 +1770,110 @@ Generate comprehensive, production-ready test cases now:
         
         return files_saved
     
-    def _parse_filename_format(self, response_text: str) -> List[str]:
+    def _parse_filename_format(self, response_text: str, seen: set) -> List[str]:
         """Parse FILENAME: format"""
         files_saved = []
-        filename_pattern = r'FILENAME:\s*(\S+\.spec\.ts)\s*\n(.*?)(?=FILENAME:|$)'
-        matches = re.findall(filename_pattern, response_text, re.DOTALL)
-        
+        matches = _FILENAME_RE.findall(response_text)
+
         for filename, content in matches:
+            if filename in seen:
+                continue
             content = content.strip()
             if content:
                 if self._save_file(filename, content):
                     files_saved.append(filename)
+                    seen.add(filename)
                     print(f"✅ Found test file marker: {filename}")
-        
+
         return files_saved
-    
-    def _parse_hash_format(self, response_text: str) -> List[str]:
+
+    def _parse_hash_format(self, response_text: str, seen: set) -> List[str]:
         """Parse #### filename.spec.ts format"""
         files_saved = []
-        hash_pattern = r'####\s*(\S+\.spec\.ts)\s*\n```typescript\s*\n(.*?)\n```'
-        hash_matches = re.findall(hash_pattern, response_text, re.DOTALL)
-        
+        hash_matches = _HASH_RE.findall(response_text)
+
         for filename, content in hash_matches:
+            if filename in seen:
+                continue
             content = content.strip()
             if content:
                 if self._save_file(filename, content):
                     files_saved.append(filename)
+                    seen.add(filename)
                     print(f"✅ Found test file marker: {filename}")
-        
+
         return files_saved
-    
-    def _parse_markdown_format(self, response_text: str) -> List[str]:
+
+    def _parse_markdown_format(self, response_text: str, seen: set) -> List[str]:
         """Parse markdown code blocks with filename extraction"""
         files_saved = []
-        
+
         # Strategy 1: Look for filename.spec.ts: followed by markdown code block
-        filename_pattern = r'(\w+\.spec\.ts):\s*\n```typescript\s*\n(.*?)\n```'
-        matches = re.findall(filename_pattern, response_text, re.DOTALL)
-        
+        matches = _MD_NAMED_RE.findall(response_text)
+
         for filename, content in matches:
+            if filename in seen:
+                continue
             content = content.strip()
             if content:
                 if self._save_file(filename, content):
                     files_saved.append(filename)
+                    seen.add(filename)
                     print(f"✅ Found test file marker: {filename}")
         
-        # Strategy 2: Look for markdown blocks and try to extract filename from context
+        # Strategy 2: one forward pass that tracks the most recent header
+        # line naming a .spec.ts file and attaches it to the next code block,
+        # instead of re-slicing the full response per block
         if not files_saved:
-            markdown_blocks = re.findall(r'```(?:typescript|javascript|ts|js)\s*\n(.*?)\n```', response_text, re.DOTALL)
-            
-            for i, block_content in enumerate(markdown_blocks):
-                # Try to find filename in the text before the code block
-                lines_before = response_text[:response_text.find(block_content)].split('\n')
-                filename = None
-                
-                # Look for filename patterns in the preceding lines
-                for line in reversed(lines_before[-10:]):  # Check last 10 lines
-                    if '.spec.ts' in line:
-                        # Extract filename from line
-                        match = re.search(r'(\w+\.spec\.ts)', line)
-                        if match:
-                            filename = match.group(1)
-                            break
-                
-                # Fallback to generic name if no filename found
-                if not filename:
-                    filename = f"test_{i+1}.spec.ts"
-                
-                content = block_content.strip()
+            last_filename = None
+            block_index = 0
+            for match in _HEADER_OR_BLOCK_RE.finditer(response_text):
+                if match.lastgroup == 'header':
+                    name = _SPEC_NAME_RE.search(match.group('header'))
+                    if name:
+                        last_filename = name.group(1)
+                    continue
+
+                block_index += 1
+                filename = last_filename or f"test_{block_index}.spec.ts"
+                last_filename = None
+
+                if filename in seen:
+                    continue
+                content = match.group('block').strip()
                 if content:
                     if self._save_file(filename, content):
                         files_saved.append(filename)
+                        seen.add(filename)
                         print(f"✅ Found test file marker: {filename}")
         
         return files_saved
     
-    def _parse_by_content_mapping(self, response_text: str) -> List[str]:
+    def _parse_by_content_mapping(self, response_text: str, seen: set) -> List[str]:
         """Parse by mapping content to expected filenames based on test content"""
         files_saved = []
-        
-        # Expected filenames and their content indicators
-        expected_files = {
-            'visual.spec.ts': ['visual', 'responsive', 'viewport', 'theme', 'dark', 'light', 'mobile', 'desktop'],
-            'flow.spec.ts': ['flow', 'login', 'navigation', 'user', 'authentication', 'wizard', 'form'],
-            'component.spec.ts': ['component', 'interactive', 'button', 'modal', 'dropdown', 'form', 'input'],
-            'accessibility.spec.ts': ['accessibility', 'aria', 'keyboard', 'focus', 'screen reader', 'tab']
-        }
-        
+
         # Find all code blocks
-        markdown_blocks = re.findall(r'```(?:typescript|javascript|ts|js)\s*\n(.*?)\n```', response_text, re.DOTALL)
-        
+        markdown_blocks = _MD_BLOCK_RE.findall(response_text)
+
         for i, block_content in enumerate(markdown_blocks):
-            content_lower = block_content.lower()
-            
-            # Find the best matching filename based on content
-            best_match = None
-            best_score = 0
-            
-            for filename, indicators in expected_files.items():
-                score = sum(1 for indicator in indicators if indicator in content_lower)
-                if score > best_score:
-                    best_score = score
-                    best_match = filename
-            
+            # One indicator sweep per block: count matches per named group
+            # instead of probing every keyword with a separate substring scan
+            counts = Counter(m.lastgroup for m in _INDICATOR_RE.finditer(block_content))
+
             # Use the best match or fallback to generic name
-            filename = best_match if best_match else f"test_{i+1}.spec.ts"
-            
+            if counts:
+                filename = _INDICATOR_FILES[counts.most_common(1)[0][0]]
+            else:
+                filename = f"test_{i+1}.spec.ts"
+
+            if filename in seen:
+                continue
             content = block_content.strip()
             if content:
                 if self._save_file(filename, content):
                     files_saved.append(filename)
+                    seen.add(filename)
                     print(f"✅ Mapped content to: {filename}")
         
         return files_saved
@@ -1261,51 +1896,45 @@ Generate comprehensive, production-ready test cases now:
             "features": []
         }
         
+        # Accumulate into sets so duplicate checks are O(1) instead of
+        # scanning the result lists on every match
+        routes = set()
+        api_endpoints = set()
+
         # Analyze all files for functionality
         for file_path in self.files:
             filename = os.path.basename(file_path)
+            filename_lower = filename.lower()
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
+                content = self._read(file_path)
+
                 # Extract routes using enhanced method
-                routes = self._extract_routes(content)
-                for route in routes:
-                    if route not in analysis["routes"]:
-                        analysis["routes"].append(route)
-                
+                routes.update(self._extract_routes(content))
+
                 # Extract components and pages
-                if any(keyword in filename.lower() for keyword in ['page', 'component', 'view', 'screen']):
+                if any(keyword in filename_lower for keyword in ['page', 'component', 'view', 'screen']):
                     analysis["pages"].append(filename)
-                
+
                 # Extract forms
-                if 'form' in content.lower() or 'Form' in filename:
+                if 'Form' in filename or 'form' in content.lower():
                     analysis["forms"].append(filename)
-                
-                # Extract API calls
-                api_patterns = [
-                    r'fetch\(["\']([^"\']+)["\']',
-                    r'axios\.(get|post|put|delete)\(["\']([^"\']+)["\']',
-                    r'api\.([^"\']+)',
-                    r'\/api\/[^"\'\s]+'
-                ]
-                for pattern in api_patterns:
-                    matches = re.findall(pattern, content)
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            endpoint = match[1] if len(match) > 1 else match[0]
-                        else:
-                            endpoint = match
-                        if endpoint.startswith('/api/') and endpoint not in analysis["api_endpoints"]:
-                            analysis["api_endpoints"].append(endpoint)
-                
+
+                # Extract API calls - single combined scan over the content
+                for match in _API_CALL_RE.finditer(content):
+                    endpoint = match.group(match.lastgroup)
+                    if endpoint.startswith('/api/'):
+                        api_endpoints.add(endpoint)
+
                 # Extract user flows from component names and content
-                if any(keyword in filename.lower() for keyword in ['login', 'signup', 'dashboard', 'profile', 'settings', 'create', 'edit', 'delete']):
+                if any(keyword in filename_lower for keyword in ['login', 'signup', 'dashboard', 'profile', 'settings', 'create', 'edit', 'delete']):
                     analysis["user_flows"].append(filename)
-                
+
             except Exception as e:
                 print(f"⚠️ Error analyzing {filename}: {e}")
-        
+
+        analysis["routes"] = sorted(routes)
+        analysis["api_endpoints"] = sorted(api_endpoints)
+
         # Generate feature analysis
         analysis["features"] = self._extract_features(analysis)
         
@@ -1320,14 +1949,16 @@ Generate comprehensive, production-ready test cases now:
         # Extract context for the prompt - prioritize React Router routes
         router_routes = analysis.get('router_routes', {})
         if router_routes:
-            routes_list = "\n".join([f"- {route} (Component: {component})" for route, component in router_routes.items()])
+            routes_list = _bulleted(f"{route} (Component: {component})"
+                                    for route, component in router_routes.items())
             routes_list += "\n\nAdditional routes found:\n"
-            routes_list += "\n".join([f"- {route}" for route in analysis.get('routes', []) if route not in router_routes][:10])
+            routes_list += _bulleted(itertools.islice(
+                (route for route in analysis.get('routes', []) if route not in router_routes), 10))
         else:
-            routes_list = "\n".join([f"- {route}" for route in analysis.get('routes', [])[:20]])
-        
-        components_list = "\n".join([f"- {comp}" for comp in analysis.get('pages', [])[:20]])
-        api_endpoints_list = "\n".join([f"- {endpoint}" for endpoint in analysis.get('api_endpoints', [])[:15]])
+            routes_list = _bulleted(analysis.get('routes', [])[:20])
+
+        components_list = _bulleted(analysis.get('pages', [])[:20])
+        api_endpoints_list = _bulleted(analysis.get('api_endpoints', [])[:15])
         
         # Get detailed component analysis
         component_details = self._analyze_component_details()
@@ -1409,19 +2040,17 @@ OUTPUT FORMAT - Generate ONE flow for EACH route:
 
 **CRITICAL**: Generate flows based on the ACTUAL routes and components provided above. Use the exact names and create realistic user interactions. Do NOT provide generic advice - analyze the real codebase and generate specific flows."""
         
-        print(f"🔄 Sending user flow generation prompt to Ollama (model: {OLLAMA_MODEL})")
+        print(f"🔄 Sending user flow generation prompt to Ollama (model: {CFG.ollama_model})")
         print(f"ℹ️ Prompt length: {len(user_flow_prompt)} characters")
         
         # Save the prompt for debugging
         prompt_file = f"{LOG_DIR}/user_flow_prompt_{self.run_timestamp}.txt"
-        os.makedirs(LOG_DIR, exist_ok=True)
-        with open(prompt_file, 'w', encoding='utf-8') as f:
-            f.write(user_flow_prompt)
+        Path(prompt_file).write_text(user_flow_prompt, encoding='utf-8')
         print(f"📝 User flow prompt saved: {prompt_file}")
         
         # Call Ollama API
         request_data = {
-            'model': OLLAMA_MODEL,
+            'model': CFG.ollama_model,
             'prompt': user_flow_prompt,
             'stream': False,
             'options': {
@@ -1433,8 +2062,8 @@ OUTPUT FORMAT - Generate ONE flow for EACH route:
         }
         
         try:
-            response = requests.post(
-                OLLAMA_API_URL,
+            response = self.session.post(
+                CFG.ollama_api_url,
                 json=request_data,
                 timeout=120
             )
@@ -1458,7 +2087,6 @@ OUTPUT FORMAT - Generate ONE flow for EACH route:
     def _save_user_flows_report(self, content: str) -> None:
         """Save user flows report to reports directory"""
         try:
-            os.makedirs(REPORT_DIR, exist_ok=True)
             report_path = os.path.join(REPORT_DIR, "user_flows.md")
             
             # Add header to the report
@@ -1477,215 +2105,48 @@ This report describes the distinct user flows identified in the application base
 *Report generated by AI Playwright Test Generator*
 """
             
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-            
+            _write_atomic(report_path, report_content)
+
             print(f"✅ User flows report saved: {report_path}")
         except Exception as e:
             print(f"❌ Error saving user flows report: {e}")
     
-    def _analyze_component_details(self) -> str:
-        """Analyze component files to extract detailed UI information"""
-        print("🔍 Analyzing component details for UI elements")
-        
-        component_details = []
-        
+    def _analyze_all(self) -> None:
+        """Run component, form, and UI analysis in one fused pass: each file
+        is dispatched to the worker pool once and scanned once, instead of
+        three separate pool rounds over overlapping file sets"""
+        print("🔍 Analyzing components, forms, and UI elements")
+
+        names = []
+        contents = []
+        comp_flags = []
+        form_flags = []
         for file_path in self.files:
             filename = os.path.basename(file_path)
-            if self.file_roles.get(filename) == 'Component':
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Extract component information
-                    details = self._extract_component_info(filename, content)
-                    if details:
-                        component_details.append(details)
-                        
-                except Exception as e:
-                    print(f"⚠️ Error analyzing component {filename}: {e}")
-        
-        return "\n".join(component_details[:15]) if component_details else "No detailed component analysis available"
-    
-    def _extract_component_info(self, filename: str, content: str) -> str:
-        """Extract detailed information from a component file"""
-        info_parts = [f"**{filename}**:"]
-        
-        # Extract form elements
-        form_elements = []
-        input_patterns = [
-            r'<input[^>]*type=["\']([^"\']*)["\'][^>]*placeholder=["\']([^"\']*)["\'][^>]*>',
-            r'<input[^>]*placeholder=["\']([^"\']*)["\'][^>]*type=["\']([^"\']*)["\'][^>]*>',
-            r'<input[^>]*name=["\']([^"\']*)["\'][^>]*>',
-            r'<textarea[^>]*placeholder=["\']([^"\']*)["\'][^>]*>',
-            r'<select[^>]*>',
-            r'<button[^>]*>([^<]*)</button>'
-        ]
-        
-        for pattern in input_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    form_elements.append(f"  - {match[0]}: {match[1] if len(match) > 1 else 'field'}")
-                else:
-                    form_elements.append(f"  - {match}")
-        
-        if form_elements:
-            info_parts.append("  Form Elements:")
-            info_parts.extend(form_elements[:5])  # Limit to 5 elements
-        
-        # Extract API calls
-        api_calls = re.findall(r'(?:fetch|axios|api)\(["\']([^"\']+)["\']', content)
-        if api_calls:
-            info_parts.append("  API Calls:")
-            for api in api_calls[:3]:  # Limit to 3 API calls
-                info_parts.append(f"    - {api}")
-        
-        # Extract state management
-        state_patterns = [
-            r'useState\(["\']([^"\']*)["\']',
-            r'setState\(["\']([^"\']*)["\']',
-            r'const\s+(\w+)\s*=\s*useState'
-        ]
-        
-        states = []
-        for pattern in state_patterns:
-            matches = re.findall(pattern, content)
-            states.extend(matches)
-        
-        if states:
-            info_parts.append("  State Variables:")
-            for state in states[:3]:  # Limit to 3 states
-                info_parts.append(f"    - {state}")
-        
-        return "\n".join(info_parts) if len(info_parts) > 1 else ""
-    
-    def _analyze_form_components(self) -> str:
-        """Analyze form components specifically"""
-        print("🔍 Analyzing form components")
-        
+            names.append(filename)
+            contents.append(self._read(file_path))
+            comp_flags.append(filename in self._component_files)
+            form_flags.append(filename in self._form_files)
+
+        component_details = []
         form_details = []
-        
-        for file_path in self.files:
-            filename = os.path.basename(file_path)
-            if 'form' in filename.lower() or self.file_roles.get(filename) == 'Form':
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    form_info = self._extract_form_details(filename, content)
-                    if form_info:
-                        form_details.append(form_info)
-                        
-                except Exception as e:
-                    print(f"⚠️ Error analyzing form {filename}: {e}")
-        
-        return "\n".join(form_details[:10]) if form_details else "No form components detected"
-    
-    def _extract_form_details(self, filename: str, content: str) -> str:
-        """Extract detailed form information"""
-        form_parts = [f"**{filename}**:"]
-        
-        # Extract form fields with validation
-        field_patterns = [
-            r'<input[^>]*name=["\']([^"\']*)["\'][^>]*required[^>]*>',
-            r'<input[^>]*required[^>]*name=["\']([^"\']*)["\'][^>]*>',
-            r'<textarea[^>]*name=["\']([^"\']*)["\'][^>]*>',
-            r'<select[^>]*name=["\']([^"\']*)["\'][^>]*>'
-        ]
-        
-        fields = []
-        for pattern in field_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            fields.extend(matches)
-        
-        if fields:
-            form_parts.append("  Required Fields:")
-            for field in fields[:5]:
-                form_parts.append(f"    - {field}")
-        
-        # Extract validation rules
-        validation_patterns = [
-            r'minLength[=:]\s*(\d+)',
-            r'maxLength[=:]\s*(\d+)',
-            r'pattern[=:]\s*["\']([^"\']*)["\']',
-            r'required[=:]\s*true'
-        ]
-        
-        validations = []
-        for pattern in validation_patterns:
-            matches = re.findall(pattern, content)
-            validations.extend(matches)
-        
-        if validations:
-            form_parts.append("  Validation Rules:")
-            for validation in validations[:3]:
-                form_parts.append(f"    - {validation}")
-        
-        # Extract submit handlers
-        submit_patterns = [
-            r'onSubmit[=:]\s*{([^}]+)}',
-            r'handleSubmit[=:]\s*{([^}]+)}',
-            r'submit[=:]\s*{([^}]+)}'
-        ]
-        
-        submit_handlers = []
-        for pattern in submit_patterns:
-            matches = re.findall(pattern, content)
-            submit_handlers.extend(matches)
-        
-        if submit_handlers:
-            form_parts.append("  Submit Handlers:")
-            for handler in submit_handlers[:2]:
-                form_parts.append(f"    - {handler[:50]}...")
-        
-        return "\n".join(form_parts) if len(form_parts) > 1 else ""
-    
-    def _analyze_ui_elements(self) -> str:
-        """Analyze UI elements across all components"""
-        print("🔍 Analyzing UI elements and interactions")
-        
-        ui_elements = {
-            'buttons': [],
-            'modals': [],
-            'navigation': [],
-            'dropdowns': [],
-            'tables': [],
-            'cards': []
-        }
-        
-        for file_path in self.files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract buttons
-                button_matches = re.findall(r'<button[^>]*>([^<]*)</button>', content, re.IGNORECASE)
-                ui_elements['buttons'].extend([btn.strip() for btn in button_matches if btn.strip()])
-                
-                # Extract modals
-                modal_matches = re.findall(r'(?:Modal|Dialog|Popup)[^>]*title=["\']([^"\']*)["\']', content, re.IGNORECASE)
-                ui_elements['modals'].extend(modal_matches)
-                
-                # Extract navigation
-                nav_matches = re.findall(r'<nav[^>]*>([^<]*)</nav>', content, re.IGNORECASE)
-                ui_elements['navigation'].extend([nav.strip() for nav in nav_matches if nav.strip()])
-                
-                # Extract dropdowns
-                dropdown_matches = re.findall(r'<select[^>]*>', content, re.IGNORECASE)
-                ui_elements['dropdowns'].extend(dropdown_matches)
-                
-                # Extract tables
-                table_matches = re.findall(r'<table[^>]*>', content, re.IGNORECASE)
-                ui_elements['tables'].extend(table_matches)
-                
-                # Extract cards
-                card_matches = re.findall(r'(?:Card|Panel|Box)[^>]*>', content, re.IGNORECASE)
-                ui_elements['cards'].extend(card_matches)
-                
-            except Exception as e:
-                print(f"⚠️ Error analyzing UI elements in {file_path}: {e}")
-        
+        ui_elements = {element_type: [] for element_type in _UI_SENTINELS}
+        if names:
+            with ProcessPoolExecutor() as executor:
+                for result in executor.map(_scan_file_details, names, contents,
+                                           comp_flags, form_flags, chunksize=16):
+                    if result['component']:
+                        component_details.append(result['component'])
+                    if result['form']:
+                        form_details.append(result['form'])
+                    for element_type, matches in result['ui'].items():
+                        ui_elements[element_type].extend(matches)
+
+        self._component_details = ("\n".join(component_details[:15])
+                                   if component_details else "No detailed component analysis available")
+        self._form_analysis = ("\n".join(form_details[:10])
+                               if form_details else "No form components detected")
+
         # Format UI elements analysis
         analysis_parts = []
         for element_type, elements in ui_elements.items():
@@ -1694,69 +2155,41 @@ This report describes the distinct user flows identified in the application base
                 for element in elements[:5]:  # Limit to 5 per type
                     analysis_parts.append(f"  - {element}")
                 analysis_parts.append("")
-        
-        return "\n".join(analysis_parts) if analysis_parts else "No specific UI elements detected"
+
+        self._ui_analysis = "\n".join(analysis_parts) if analysis_parts else "No specific UI elements detected"
+
+    def _analyze_component_details(self) -> str:
+        """Analyze component files to extract detailed UI information"""
+        if self._component_details is None:
+            self._analyze_all()
+        return self._component_details
+    
+    def _analyze_form_components(self) -> str:
+        """Analyze form components specifically"""
+        if self._form_analysis is None:
+            self._analyze_all()
+        return self._form_analysis
+    
+    def _analyze_ui_elements(self) -> str:
+        """Analyze UI elements across all components"""
+        if self._ui_analysis is None:
+            self._analyze_all()
+        return self._ui_analysis
     
     def _extract_features(self, analysis: Dict[str, Any]) -> List[str]:
         """Extract application features from analysis"""
+        # Lowercase the corpus once, then walk one token table: each
+        # feature costs a handful of substring probes against a prebuilt
+        # string instead of re-iterating routes and pages per keyword
+        routes = ' '.join(r.lower() for r in analysis["routes"])
+        corpus = routes + ' ' + ' '.join(p.lower() for p in analysis["pages"])
+
         features = []
-        
-        # Dashboard features
-        if any('dashboard' in route.lower() or 'dashboard' in page.lower() for route in analysis["routes"] for page in analysis["pages"]):
-            features.append("Dashboard Management")
-        
-        # CRUD operations
-        if any('create' in route.lower() or 'create' in page.lower() for route in analysis["routes"] for page in analysis["pages"]):
-            features.append("Create Operations")
-        if any('edit' in route.lower() or 'edit' in page.lower() for route in analysis["routes"] for page in analysis["pages"]):
-            features.append("Edit Operations")
-        if any('delete' in route.lower() or 'delete' in page.lower() for route in analysis["routes"] for page in analysis["pages"]):
-            features.append("Delete Operations")
-        
-        # Project management
-        if any('project' in route.lower() or 'project' in page.lower() for route in analysis["routes"] for page in analysis["pages"]):
-            features.append("Project Management")
-        
-        # User management
-        if any('user' in route.lower() or 'profile' in route.lower() for route in analysis["routes"]):
-            features.append("User Management")
-        
-        # Content management
-        if any('content' in route.lower() or 'content' in page.lower() for route in analysis["routes"] for page in analysis["pages"]):
-            features.append("Content Management")
-        
-        # File management
-        if any('file' in route.lower() or 'upload' in route.lower() or 'download' in route.lower() for route in analysis["routes"]):
-            features.append("File Management")
-        
-        # Search and filtering
-        if any('search' in route.lower() or 'filter' in route.lower() for route in analysis["routes"]):
-            features.append("Search and Filtering")
-        
-        # Settings and configuration
-        if any('setting' in route.lower() or 'config' in route.lower() for route in analysis["routes"]):
-            features.append("Settings and Configuration")
-        
-        # E-commerce features
-        if any('cart' in route.lower() or 'checkout' in route.lower() or 'order' in route.lower() for route in analysis["routes"]):
-            features.append("E-commerce")
-        
-        # Blog/content features
-        if any('blog' in route.lower() or 'post' in route.lower() or 'article' in route.lower() for route in analysis["routes"]):
-            features.append("Blog/Content Publishing")
-        
-        # Analytics and reporting
-        if any('analytics' in route.lower() or 'report' in route.lower() or 'stats' in route.lower() for route in analysis["routes"]):
-            features.append("Analytics and Reporting")
-        
-        # Communication features
-        if any('message' in route.lower() or 'chat' in route.lower() or 'notification' in route.lower() for route in analysis["routes"]):
-            features.append("Communication")
-        
-        # Calendar/scheduling
-        if any('calendar' in route.lower() or 'schedule' in route.lower() or 'event' in route.lower() for route in analysis["routes"]):
-            features.append("Calendar/Scheduling")
-        
+        for name, tokens, routes_only in _FEATURE_TOKENS:
+            haystack = routes if routes_only else corpus
+            if any(token in haystack for token in tokens):
+                features.append(name)
+
         return features
     
     def _generate_comprehensive_report(self, analysis: Dict[str, Any], validation_results: Dict[str, Any]) -> str:
@@ -1774,25 +2207,25 @@ Repository: {self.temp_dir}
 
 ## Application Structure
 ### Routes ({len(analysis['routes'])})
-{chr(10).join([f"- {route}" for route in analysis['routes'][:20]])}
+{_bulleted(analysis['routes'][:20])}
 
 ### Pages/Components ({len(analysis['pages'])})
-{chr(10).join([f"- {page}" for page in analysis['pages'][:20]])}
+{_bulleted(analysis['pages'][:20])}
 
 ### API Endpoints ({len(analysis['api_endpoints'])})
-{chr(10).join([f"- {endpoint}" for endpoint in analysis['api_endpoints'][:20]])}
+{_bulleted(analysis['api_endpoints'][:20])}
 
 ### Forms ({len(analysis['forms'])})
-{chr(10).join([f"- {form}" for form in analysis['forms'][:10]])}
+{_bulleted(analysis['forms'][:10])}
 
 ## Application Features
-{chr(10).join([f"- {feature}" for feature in analysis['features']])}
+{_bulleted(analysis['features'])}
 
 ## User Flows Identified
-{chr(10).join([f"- {flow}" for flow in analysis['user_flows'][:15]])}
+{_bulleted(analysis['user_flows'][:15])}
 
 ## File Roles Classification
-{chr(10).join([f"- {filename}: {role}" for filename, role in list(self.file_roles.items())[:20]])}
+{_bulleted(f"{filename}: {role}" for filename, role in itertools.islice(self.file_roles.items(), 20))}
 
 ## Test Generation Recommendations
 Based on the analysis, the following test scenarios should be prioritized:
@@ -1827,10 +2260,10 @@ Based on the analysis, the following test scenarios should be prioritized:
 - **Validation Errors**: {len(validation_results['validation_errors'])}
 
 ## Technical Details
-- **Max File Size**: {MAX_FILE_SIZE} bytes
+- **Max File Size**: {CFG.max_file_size} bytes
 - **Analysis Depth**: Comprehensive
 - **Framework**: {self.framework}
-- **Total Components**: {len([f for f, r in self.file_roles.items() if r == 'Component'])}
+- **Total Components**: {len(self._roles_index.get('Component', ()))}
 
 ---
 Report generated by AI Playwright Test Generator
@@ -1841,35 +2274,32 @@ Report generated by AI Playwright Test Generator
     def _save_report(self, report: str) -> None:
         """Save comprehensive report to reports directory"""
         try:
-            os.makedirs(REPORT_DIR, exist_ok=True)
             report_filename = f"analysis_report_{self.run_timestamp}.md"
             report_path = os.path.join(REPORT_DIR, report_filename)
             
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(report)
-            
+            _write_atomic(report_path, report)
+
             print(f"✅ Comprehensive report saved: {report_path}")
         except Exception as e:
             print(f"❌ Error saving report: {e}")
     
     def _is_valid_test_content(self, content: str) -> bool:
         """Validate that test content is complete and valid"""
-        if not content or len(content.strip()) < 100:
+        # Checks ordered cheapest-first so rejected content short-circuits
+        # before any full scan; the raw-length probe skips the strip() copy
+        # for content that is too short either way
+        if not content or len(content) < 100 or len(content.strip()) < 100:
             return False
-        
-        # Check for basic test structure
-        has_imports = "import { test, expect }" in content
-        has_tests = "test(" in content or "test.describe" in content
-        has_closing = content.count('{') == content.count('}')  # Basic bracket matching
-        
-        return has_imports and has_tests and has_closing
+        if "import { test, expect }" not in content:
+            return False
+        if "test(" not in content and "test.describe" not in content:
+            return False
+        return content.count('{') == content.count('}')  # Basic bracket matching
     
     def _save_file(self, filename: str, content: str) -> bool:
-        """Save test file to disk"""
+        """Stage a test file; the batch flush writes everything in one pass"""
         try:
-            file_path = os.path.join(TEST_OUTPUT_DIR, filename)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self._pending_tests[filename] = content
             print(f"ℹ️ Saving file: {filename} ({len(content)} characters)")
             print(f"📊 File Content - {filename}: {content[:100]}...")
             print(f"✅ Generated: {TEST_OUTPUT_DIR}/{filename}")
@@ -1877,7 +2307,27 @@ Report generated by AI Playwright Test Generator
         except Exception as e:
             print(f"❌ Error saving {filename}: {e}")
             return False
-    
+
+    def _flush_test_files(self) -> List[str]:
+        """Write every staged test file to disk in one batch; the writes only
+        touch the filesystem here, overlapped on a small thread pool"""
+        if not self._pending_tests:
+            return []
+
+        def _write_one(item):
+            filename, content = item
+            try:
+                Path(os.path.join(TEST_OUTPUT_DIR, filename)).write_text(content, encoding='utf-8')
+                return filename
+            except Exception as e:
+                print(f"❌ Error saving {filename}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            written = [name for name in pool.map(_write_one, self._pending_tests.items()) if name]
+        print(f"💾 Flushed {len(written)} test files to {TEST_OUTPUT_DIR}")
+        return written
+
     def _validate_tests(self, test_files: List[str]) -> Dict[str, Any]:
         """Validate generated test files"""
         validation_results = {
@@ -1889,14 +2339,18 @@ Report generated by AI Playwright Test Generator
         
         for test_file in test_files:
             try:
-                with open(f"{TEST_OUTPUT_DIR}/{test_file}", 'r') as f:
-                    content = f.read()
-                    # Basic validation - check for Playwright imports and test structure
-                    if "import { test, expect }" in content and ("test.describe" in content or "test('" in content):
-                        validation_results["valid_tests"] += 1
-                    else:
-                        validation_results["invalid_tests"] += 1
-                        validation_results["validation_errors"].append(f"Invalid test structure in {test_file}")
+                # Validate from the staged content; the files were generated
+                # this run, so there is nothing new to read back from disk
+                content = self._pending_tests.get(test_file)
+                if content is None:
+                    with open(f"{TEST_OUTPUT_DIR}/{test_file}", 'r') as f:
+                        content = f.read()
+                # Basic validation - check for Playwright imports and test structure
+                if _VALID_TEST_RE.search(content):
+                    validation_results["valid_tests"] += 1
+                else:
+                    validation_results["invalid_tests"] += 1
+                    validation_results["validation_errors"].append(f"Invalid test structure in {test_file}")
             except Exception as e:
                 validation_results["invalid_tests"] += 1
                 validation_results["validation_errors"].append(f"Error reading {test_file}: {str(e)}")
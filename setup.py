@@ -71,14 +71,13 @@ def install_dependencies():
     """Install Python dependencies"""
     # Use python3 if available, otherwise python
     python_cmd = "python3" if shutil.which("python3") else "python"
-    pip_cmd = f"{python_cmd} -m pip install --upgrade pip"
-    
-    if not run_command(pip_cmd, "Upgrading pip"):
-        return False
-    
-    if not run_command(f"{python_cmd} -m pip install -r requirements.txt", "Installing Python dependencies"):
+    # One pip invocation upgrades pip and installs the requirements; pip
+    # resolves everything in a single process instead of two launches
+    pip_cmd = f"{python_cmd} -m pip install --upgrade pip -r requirements.txt"
+
+    if not run_command(pip_cmd, "Installing Python dependencies"):
         return False
-    
+
     return True
 
 def create_env_file():
@@ -127,15 +126,19 @@ GITHUB_TOKEN=
 
 def check_ollama():
     """Check if Ollama is installed and running"""
-    try:
-        result = subprocess.run(["ollama", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Ollama is installed")
-            print(f"   Version: {result.stdout.strip()}")
-            return True
-    except FileNotFoundError:
-        pass
-    
+    # PATH probe first: shutil.which is a few stat calls, so the missing-binary
+    # case never pays for spawning a subprocess
+    if shutil.which("ollama") is None:
+        print("⚠️ Ollama is not installed or not in PATH")
+        print("   Install from: https://ollama.com")
+        return False
+
+    result = subprocess.run(["ollama", "--version"], capture_output=True, text=True)
+    if result.returncode == 0:
+        print("✅ Ollama is installed")
+        print(f"   Version: {result.stdout.strip()}")
+        return True
+
     print("⚠️ Ollama is not installed or not in PATH")
     print("   Install from: https://ollama.com")
     return False